@@ -0,0 +1,4 @@
+"""
+Pytest configuration for WinRegi
+Puts the repository root on sys.path so tests can import the src package
+"""
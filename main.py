@@ -324,16 +324,6 @@ def main():
     app.setApplicationName("WinRegi")
     app.setOrganizationName("WinRegi")
     
-    # Load custom stylesheet if available
-    custom_style_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "custom_styles.css")
-    if os.path.exists(custom_style_path):
-        try:
-            with open(custom_style_path, 'r') as f:
-                custom_style = f.read()
-                app.setStyleSheet(custom_style)
-        except Exception as e:
-            print(f"Error loading custom stylesheet: {e}")
-    
     # Show splash screen
     splash = show_splash_screen(args)
     
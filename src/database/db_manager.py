@@ -396,6 +396,38 @@ class DatabaseManager:
             print(f"Error getting command by ID: {e}")
             return None
     
+    def get_commands_by_ids(self, command_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several commands in a single query
+        
+        Unlike get_command_by_id, this does not touch last_used; use
+        update_commands_usage for that.
+        
+        Args:
+            command_ids: IDs of the commands to retrieve
+            
+        Returns:
+            Dictionary mapping each found command ID to its details
+        """
+        if not command_ids:
+            return {}
+        
+        try:
+            if not self.conn:
+                self.connect()
+            
+            placeholders = ",".join("?" * len(command_ids))
+            self.cursor.execute(f"""
+                SELECT c.*, cat.name as category_name
+                FROM custom_commands c
+                LEFT JOIN categories cat ON c.category_id = cat.id
+                WHERE c.id IN ({placeholders})
+            """, tuple(command_ids))
+            
+            return {row["id"]: dict(row) for row in self.cursor.fetchall()}
+        except Exception as e:
+            print(f"Error getting commands by ID: {e}")
+            return {}
+    
     def add_command(self, name: str, description: str, command_type: str, command_value: str, 
                   category_id: int = None, tags: str = None) -> int:
         """Add a new custom command
@@ -515,6 +547,39 @@ class DatabaseManager:
                 self.conn.rollback()
             return False
     
+    def update_commands_usage(self, command_ids: List[int]) -> bool:
+        """Update the last used timestamp for several commands at once
+        
+        Args:
+            command_ids: IDs of the commands that were used
+            
+        Returns:
+            True if any timestamp was updated, False otherwise
+        """
+        if not command_ids:
+            return False
+        
+        try:
+            if not self.conn:
+                self.connect()
+                
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            placeholders = ",".join("?" * len(command_ids))
+            
+            self.cursor.execute(f"""
+                UPDATE custom_commands
+                SET last_used = ?
+                WHERE id IN ({placeholders})
+            """, (current_time, *command_ids))
+            
+            self.conn.commit()
+            return self.cursor.rowcount > 0
+        except Exception as e:
+            print(f"Error updating command usage: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return False
+    
     def search_commands(self, query: str) -> List[Dict[str, Any]]:
         """Search for commands matching the given query
         
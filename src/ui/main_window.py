@@ -226,7 +226,7 @@ class SidebarNavigation(QWidget):
         main_window = self.window()
         
         theme_toggle = ThemeToggleSwitch()
-        theme_toggle.setChecked(main_window.theme_manager.current_theme == "dark")
+        theme_toggle.setChecked(main_window.theme_manager.current_theme == "dark", animate=False)
         theme_toggle.toggled.connect(main_window.toggle_theme)
         theme_layout.addWidget(theme_toggle)
         
@@ -362,7 +362,7 @@ class MainWindow(QMainWindow):
         self.init_ui()
         
         # Apply initial theme - load from saved config
-        self.theme_manager.apply_theme(self.theme_manager.current_theme)
+        self.theme_manager.apply_theme(self.theme_manager.current_theme, save=False)
     
     def init_ui(self):
         """Initialize user interface"""
@@ -386,8 +386,8 @@ class MainWindow(QMainWindow):
         container_layout.setSpacing(0)
         
         # Create header
-        header = self.create_header()
-        container_layout.addWidget(header)
+        self.app_header = self.create_header()
+        container_layout.addWidget(self.app_header)
         
         # Create content layout (sidebar + main content)
         content_layout = QHBoxLayout()
@@ -693,9 +693,9 @@ class MainWindow(QMainWindow):
         """
         # Check if left button was pressed on header
         if event.button() == Qt.LeftButton:
-            # Find header widget
-            header = self.findChild(QWidget, "app-header")
-            if header and header.geometry().contains(event.pos()):
+            # Use the header created in init_ui instead of searching the widget tree
+            header = self.app_header
+            if header.geometry().contains(event.pos()):
                 # Store initial position
                 self._drag_pos = event.globalPos() - self.frameGeometry().topLeft()
                 event.accept()
@@ -128,6 +128,19 @@ class SearchPage(QWidget):
     def show_results(self, results):
         """Show search results
         
+        Args:
+            results: List of search results
+        """
+        # Repaint the results area once, after every card has been added
+        self.results_container.setUpdatesEnabled(False)
+        try:
+            self._populate_results(results)
+        finally:
+            self.results_container.setUpdatesEnabled(True)
+    
+    def _populate_results(self, results):
+        """Fill the results layout with result cards
+        
         Args:
             results: List of search results
         """
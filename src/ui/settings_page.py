@@ -195,13 +195,10 @@ class SettingsPage(QWidget):
         categories = self.db_manager.get_all_categories()
         
         # Add categories to list
-        for category in categories:
-            self.category_list.add_category(
-                category['id'],
-                category['name'],
-                category['description'],
-                category['icon_path']
-            )
+        self.category_list.add_categories(
+            (category['id'], category['name'], category['description'], category['icon_path'])
+            for category in categories
+        )
     
     def on_category_selected(self, category_id):
         """Handle category selection
@@ -228,6 +225,19 @@ class SettingsPage(QWidget):
     def load_category_settings(self, category_id):
         """Load settings for a category
         
+        Args:
+            category_id: Category ID
+        """
+        # Repaint the settings panel once, after every card has been added
+        self.settings_container.setUpdatesEnabled(False)
+        try:
+            self._populate_settings(category_id)
+        finally:
+            self.settings_container.setUpdatesEnabled(True)
+    
+    def _populate_settings(self, category_id):
+        """Fill the settings layout with cards for a category
+        
         Args:
             category_id: Category ID
         """
@@ -2,11 +2,102 @@
 Theme manager for WinRegi application
 Handles application theme switching and styling
 """
+import os
+import re
+import string
+
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QLabel, QSlider, QApplication
 )
-from PyQt5.QtCore import Qt, QPropertyAnimation, pyqtProperty, QEasingCurve, pyqtSignal
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
+from PyQt5.QtCore import Qt, QPropertyAnimation, pyqtProperty, QEasingCurve, pyqtSignal, QRect, QTimer
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath, QPixmap
+
+# Application resource directories
+_RESOURCES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "resources"
+)
+_THEMES_DIR = os.path.join(_RESOURCES_DIR, "themes")
+
+# Color palette for each theme, substituted into the shared base stylesheet
+_THEME_PALETTES = {
+    "light": {
+        "window_bg": "#f5f5f5",
+        "surface_bg": "#ffffff",
+        "panel_bg": "#f5f5f5",
+        "card_bg": "#ffffff",
+        "border": "#e0e0e0",
+        "title_text": "#333333",
+        "text": "#333333",
+        "muted_text": "#666666",
+        "hover_bg": "#e8e8e8",
+        "selected_bg": "#e0f2f1",
+        "accent": "#28C058",
+        "accent_hover": "#3ec669",
+        "accent_pressed": "#21a34b",
+        "button_bg": "#f0f0f0",
+        "button_border": "#e0e0e0",
+        "button_hover_bg": "#e8e8e8",
+        "button_pressed_bg": "#d6d6d6",
+        "control_hover_bg": "#e0e0e0",
+        "badge_bg": "#f5f9ff"
+    },
+    "dark": {
+        "window_bg": "#121212",
+        "surface_bg": "#1e1e1e",
+        "panel_bg": "#252525",
+        "card_bg": "#252525",
+        "border": "#333333",
+        "title_text": "#ffffff",
+        "text": "#e0e0e0",
+        "muted_text": "#aaaaaa",
+        "hover_bg": "#333333",
+        "selected_bg": "#1e372a",
+        "accent": "#38E078",
+        "accent_hover": "#4ce386",
+        "accent_pressed": "#2cc466",
+        "button_bg": "#333333",
+        "button_border": "#444444",
+        "button_hover_bg": "#444444",
+        "button_pressed_bg": "#555555",
+        "control_hover_bg": "#333333",
+        "badge_bg": "#2a2f38"
+    }
+}
+
+# Toggle switch colors shared by every switch instance
+_TRACK_OFF_COLOR = QColor(200, 200, 200)
+_THUMB_OFF_COLOR = QColor(255, 255, 255)
+_ACCENT_COLOR = QColor(56, 224, 120)
+
+# Theme entry in the single-key theme config file
+_THEME_CONFIG_RE = re.compile(r'"theme"\s*:\s*"(\w+)"')
+
+# Patterns used to shrink stylesheets before Qt parses them
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_UNSUPPORTED_RE = re.compile(
+    r"([{;])\s*(?:transition|backdrop-filter|transform|box-shadow)\s*:[^;{}]*;?"
+)
+_QSS_WHITESPACE_RE = re.compile(r"\s+")
+_QSS_PUNCTUATION_RE = re.compile(r"\s*([{};,])\s*")
+
+def _minify_qss(stylesheet):
+    """Strip comments and collapse whitespace in a Qt stylesheet
+    
+    Declarations of web-only properties that Qt does not support
+    (transition, backdrop-filter, transform, box-shadow) are dropped too.
+    
+    Args:
+        stylesheet: Stylesheet source
+        
+    Returns:
+        Minified stylesheet
+    """
+    stylesheet = _QSS_COMMENT_RE.sub("", stylesheet)
+    stylesheet = _QSS_UNSUPPORTED_RE.sub(r"\1", stylesheet)
+    stylesheet = _QSS_WHITESPACE_RE.sub(" ", stylesheet)
+    stylesheet = _QSS_PUNCTUATION_RE.sub(r"\1", stylesheet)
+    return stylesheet.strip()
 
 class ThemeToggleSwitch(QWidget):
     """Custom toggle switch widget for theme switching"""
@@ -27,17 +118,33 @@ class ThemeToggleSwitch(QWidget):
         
         # Initialize state
         self._checked = False
-        self._track_color = QColor(200, 200, 200)
-        self._thumb_color = QColor(255, 255, 255)
         self._track_opacity = 0.6
         
+        # Track and thumb brushes per checked state, built once and reused
+        # by every paint instead of allocating new QColor/QBrush objects
+        track_alpha = int(255 * self._track_opacity)
+        track_off_color = QColor(_TRACK_OFF_COLOR)
+        track_off_color.setAlpha(track_alpha)
+        track_on_color = QColor(_ACCENT_COLOR)
+        track_on_color.setAlpha(track_alpha)
+        self._track_brushes = (
+            QBrush(track_off_color),  # Unchecked
+            QBrush(track_on_color)    # Checked
+        )
+        self._thumb_brushes = (
+            QBrush(_THUMB_OFF_COLOR),  # Unchecked
+            QBrush(_ACCENT_COLOR)      # Checked
+        )
+        
+        # Pre-rendered track pixmaps keyed by (checked, width, height, dpr)
+        self._track_cache = {}
+        
         # Animation properties
         self._thumb_position = 4  # Start position (left)
+        self._thumb_position_i = 4  # Integer copy used by paintEvent
         
-        # Create animation
-        self._animation = QPropertyAnimation(self, b"thumb_position")
-        self._animation.setDuration(150)
-        self._animation.setEasingCurve(QEasingCurve.InOutCubic)
+        # Animation is created on the first animated toggle
+        self._animation = None
     
     def get_thumb_position(self):
         """Get thumb position property
@@ -53,8 +160,23 @@ class ThemeToggleSwitch(QWidget):
         Args:
             position: New thumb position
         """
+        old_rect = self._thumb_rect(self._thumb_position_i)
         self._thumb_position = position
-        self.update()
+        self._thumb_position_i = int(position)
+        
+        # Only repaint the area swept by the thumb
+        self.update(old_rect.united(self._thumb_rect(self._thumb_position_i)))
+    
+    def _thumb_rect(self, x):
+        """Get the area covered by the thumb at a given position
+        
+        Args:
+            x: Thumb x position
+            
+        Returns:
+            Thumb rectangle with a pixel of antialiasing margin
+        """
+        return QRect(x - 1, 2, 22, 22)
     
     # Define property for animation
     thumb_position = pyqtProperty(float, get_thumb_position, set_thumb_position)
@@ -67,11 +189,12 @@ class ThemeToggleSwitch(QWidget):
         """
         return self._checked
     
-    def setChecked(self, checked):
+    def setChecked(self, checked, animate=True):
         """Set checked state
         
         Args:
             checked: New checked state
+            animate: Whether to animate the thumb to its new position
         """
         if self._checked != checked:
             self._checked = checked
@@ -79,22 +202,36 @@ class ThemeToggleSwitch(QWidget):
             # Update thumb position based on checked state
             end_position = 28 if checked else 4
             
-            # Animate thumb position
-            self._animation.setStartValue(self._thumb_position)
-            self._animation.setEndValue(end_position)
-            self._animation.start()
-            
-            # Update colors
-            if checked:
-                self._track_color = QColor(56, 224, 120, 128)  # Green with alpha
-                self._thumb_color = QColor(56, 224, 120)  # Green
+            if animate:
+                # Animate thumb position, restarting from wherever it is now
+                animation = self._ensure_animation()
+                animation.stop()
+                animation.setStartValue(self._thumb_position)
+                animation.setEndValue(end_position)
+                animation.start()
             else:
-                self._track_color = QColor(200, 200, 200, 128)  # Gray with alpha
-                self._thumb_color = QColor(255, 255, 255)  # White
+                if self._animation is not None:
+                    self._animation.stop()
+                self.set_thumb_position(end_position)
+            
+            # Track color changed, so repaint the whole switch
+            self.update()
             
             # Emit toggled signal
             self.toggled.emit(checked)
     
+    def _ensure_animation(self):
+        """Get the thumb animation, creating it on first use
+        
+        Returns:
+            Thumb position animation
+        """
+        if self._animation is None:
+            self._animation = QPropertyAnimation(self, b"thumb_position")
+            self._animation.setDuration(150)
+            self._animation.setEasingCurve(QEasingCurve.InOutCubic)
+        return self._animation
+    
     def paintEvent(self, event):
         """Custom paint event
         
@@ -102,28 +239,62 @@ class ThemeToggleSwitch(QWidget):
             event: Paint event
         """
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        checked = self._checked
         
-        # Draw track
-        track_opacity = self._track_opacity
-        if self._checked:
-            track_color = QColor(56, 224, 120, int(255 * track_opacity))
-        else:
-            track_color = QColor(200, 200, 200, int(255 * track_opacity))
-        
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(track_color)
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), 13, 13)
+        # Blit the static track, rendering it only on first use
+        dpr = self.devicePixelRatioF()
+        key = (checked, self.width(), self.height(), dpr)
+        track = self._track_cache.get(key)
+        if track is None:
+            track = self._render_track(checked, dpr)
+            self._track_cache[key] = track
+        painter.drawPixmap(0, 0, track)
         
         # Draw thumb
-        painter.setBrush(self._thumb_color)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._thumb_brushes[checked])
         painter.drawEllipse(
-            int(self._thumb_position),
+            self._thumb_position_i,
             3,
             20,
             20
         )
     
+    def _render_track(self, checked, dpr):
+        """Render the track background to a pixmap
+        
+        Args:
+            checked: Checked state to render the track for
+            dpr: Device pixel ratio of the target screen
+            
+        Returns:
+            Track pixmap
+        """
+        width = self.width()
+        height = self.height()
+        pixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._track_brushes[checked])
+        painter.drawRoundedRect(0, 0, width, height, 13, 13)
+        painter.end()
+        
+        return pixmap
+    
+    def resizeEvent(self, event):
+        """Handle resize event
+        
+        Args:
+            event: Resize event
+        """
+        self._track_cache.clear()
+        super().resizeEvent(event)
+    
     def mousePressEvent(self, event):
         """Handle mouse press event
         
@@ -146,310 +317,148 @@ class ThemeManager:
         self.parent = parent
         self.current_theme = "light"
         
-        # Theme stylesheets
-        self.themes = {
-            "light": self._get_light_theme(),
-            "dark": self._get_dark_theme()
-        }
+        # Persisted theme selection
+        self.config_path = os.path.join(_RESOURCES_DIR, "theme_config.json")
+        self._last_saved_theme = None
+        self._save_pending = False
+        self.load_theme_config()
+        
+        # Theme palettes, only rendered once a theme is first used
+        self.themes = _THEME_PALETTES
+        self._stylesheets = {}
+        self._base_template = None
+        
+        # Theme whose stylesheet is currently set on the application
+        self._applied_theme = None
+        self._app = QApplication.instance()
+        self._last_applied_hash = None
     
-    def _get_light_theme(self):
-        """Get light theme stylesheet
+    def _load_theme_file(self, filename):
+        """Read a theme stylesheet from the themes resource directory
         
+        Args:
+            filename: Stylesheet file name
+            
         Returns:
-            Light theme stylesheet
+            Minified stylesheet contents, or an empty string if it cannot be read
         """
-        return """
-        /* Main window */
-        #main-window {
-            background-color: #f5f5f5;
-        }
-        
-        #app-container {
-            background-color: #ffffff;
-            border-radius: 10px;
-        }
-        
-        /* Header */
-        #app-header {
-            background-color: #ffffff;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        
-        #app-title {
-            color: #333333;
-        }
-        
-        #app-subtitle {
-            color: #666666;
-        }
-        
-        /* Sidebar */
-        #sidebar-nav {
-            background-color: #f5f5f5;
-            border-right: 1px solid #e0e0e0;
-        }
-        
-        #nav-button {
-            background-color: transparent;
-            color: #333333;
-            border: none;
-            text-align: left;
-            padding-left: 15px;
-        }
-        
-        #nav-button:hover {
-            background-color: #e8e8e8;
-        }
-        
-        #nav-button:checked {
-            background-color: #e0f2f1;
-            color: #28C058;
-        }
-        
-        #settings-button {
-            background-color: #f0f0f0;
-            color: #333333;
-            border: 1px solid #e0e0e0;
-        }
-        
-        #settings-button:hover {
-            background-color: #e8e8e8;
-        }
-        
-        /* Window controls */
-        #minimize-btn, #maximize-btn, #close-btn {
-            background-color: transparent;
-            border: none;
-            border-radius: 12px;
-            color: #666666;
-            font-weight: bold;
-        }
-        
-        #minimize-btn:hover, #maximize-btn:hover {
-            background-color: #e0e0e0;
-        }
-        
-        #close-btn:hover {
-            background-color: #ff5252;
-            color: white;
-        }
-        
-        /* Content area */
-        #content-area {
-            background-color: #ffffff;
-        }
-        
-        /* Status bar */
-        #status-bar {
-            background-color: #f5f5f5;
-            color: #666666;
-            border-top: 1px solid #e0e0e0;
-        }
-        
-        /* Search bar */
-        #search-heading {
-            color: #333333;
-        }
-        
-        #search-container {
-            background-color: #ffffff;
-            border: 1px solid #e0e0e0;
-        }
-        
-        #search-input {
-            border: none;
-            background-color: transparent;
-            color: #333333;
-        }
-        
-        #search-button {
-            background-color: #28C058;
-            color: white;
-            border: none;
-        }
-        
-        /* Setting cards */
-        .setting-card {
-            background-color: #ffffff;
-            border: 1px solid #e0e0e0;
-        }
-        
-        /* Action buttons */
-        .action-button {
-            background-color: #f0f0f0;
-            color: #333333;
-            border: 1px solid #e0e0e0;
-        }
-        
-        .primary-action {
-            background-color: #28C058;
-            color: white;
-            border: none;
-        }
-        
-        .warning-action {
-            background-color: #ff5252;
-            color: white;
-            border: none;
-        }
+        try:
+            with open(os.path.join(_THEMES_DIR, filename), "r", encoding="utf-8") as f:
+                return _minify_qss(f.read())
+        except Exception as e:
+            print(f"Error loading theme stylesheet {filename}: {e}")
+            return ""
+    
+    def get_stylesheet(self, theme_name):
+        """Get the stylesheet for a theme, building it on first use
+        
+        Args:
+            theme_name: Name of the theme
+            
+        Returns:
+            Theme stylesheet
         """
+        stylesheet = self._stylesheets.get(theme_name)
+        if stylesheet is None:
+            stylesheet = self._build_stylesheet(theme_name)
+            self._stylesheets[theme_name] = stylesheet
+        return stylesheet
     
-    def _get_dark_theme(self):
-        """Get dark theme stylesheet
+    def _build_stylesheet(self, theme_name):
+        """Assemble the full stylesheet for a theme
         
+        Args:
+            theme_name: Name of the theme
+            
         Returns:
-            Dark theme stylesheet
+            Theme stylesheet
         """
-        return """
-        /* Main window */
-        #main-window {
-            background-color: #121212;
-        }
-        
-        #app-container {
-            background-color: #1e1e1e;
-            border-radius: 10px;
-        }
-        
-        /* Header */
-        #app-header {
-            background-color: #1e1e1e;
-            border-bottom: 1px solid #333333;
-        }
-        
-        #app-title {
-            color: #ffffff;
-        }
-        
-        #app-subtitle {
-            color: #aaaaaa;
-        }
-        
-        /* Sidebar */
-        #sidebar-nav {
-            background-color: #252525;
-            border-right: 1px solid #333333;
-        }
-        
-        #nav-button {
-            background-color: transparent;
-            color: #e0e0e0;
-            border: none;
-            text-align: left;
-            padding-left: 15px;
-        }
-        
-        #nav-button:hover {
-            background-color: #333333;
-        }
-        
-        #nav-button:checked {
-            background-color: #1e372a;
-            color: #38E078;
-        }
-        
-        #settings-button {
-            background-color: #333333;
-            color: #e0e0e0;
-            border: 1px solid #444444;
-        }
-        
-        #settings-button:hover {
-            background-color: #444444;
-        }
-        
-        /* Window controls */
-        #minimize-btn, #maximize-btn, #close-btn {
-            background-color: transparent;
-            border: none;
-            border-radius: 12px;
-            color: #aaaaaa;
-            font-weight: bold;
-        }
-        
-        #minimize-btn:hover, #maximize-btn:hover {
-            background-color: #333333;
-        }
-        
-        #close-btn:hover {
-            background-color: #ff5252;
-            color: white;
-        }
-        
-        /* Content area */
-        #content-area {
-            background-color: #1e1e1e;
-        }
-        
-        /* Status bar */
-        #status-bar {
-            background-color: #252525;
-            color: #aaaaaa;
-            border-top: 1px solid #333333;
-        }
-        
-        /* Search bar */
-        #search-heading {
-            color: #e0e0e0;
-        }
-        
-        #search-container {
-            background-color: #252525;
-            border: 1px solid #333333;
-        }
-        
-        #search-input {
-            border: none;
-            background-color: transparent;
-            color: #e0e0e0;
-        }
-        
-        #search-button {
-            background-color: #38E078;
-            color: white;
-            border: none;
-        }
-        
-        /* Setting cards */
-        .setting-card {
-            background-color: #252525;
-            border: 1px solid #333333;
-        }
-        
-        /* Action buttons */
-        .action-button {
-            background-color: #333333;
-            color: #e0e0e0;
-            border: 1px solid #444444;
-        }
-        
-        .primary-action {
-            background-color: #38E078;
-            color: white;
-            border: none;
-        }
-        
-        .warning-action {
-            background-color: #ff5252;
-            color: white;
-            border: none;
-        }
+        # Base stylesheet is read and compiled once, then shared by all themes
+        if self._base_template is None:
+            self._base_template = string.Template(self._load_theme_file("base.qss"))
+        
+        return self._base_template.safe_substitute(self.themes[theme_name])
+    
+    def load_theme_config(self):
+        """Load the saved theme selection from the config file"""
+        try:
+            with open(self.config_path, "r") as f:
+                match = _THEME_CONFIG_RE.search(f.read())
+            theme = match.group(1) if match else None
+            if theme in ("light", "dark"):
+                self.current_theme = theme
+                self._last_saved_theme = theme
+        except:
+            pass
+    
+    def save_theme_config(self):
+        """Save the current theme selection to the config file
+        
+        The payload is written to a temporary file in a single call and then
+        moved into place, so an interrupted write never leaves a torn config.
+        Nothing is written if the file already holds the current theme.
         """
+        if self.current_theme == self._last_saved_theme:
+            return
+        
+        try:
+            data = b'{"theme": "%s"}' % self.current_theme.encode()
+            tmp_path = self.config_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+            self._last_saved_theme = self.current_theme
+        except:
+            pass
     
-    def apply_theme(self, theme_name):
+    def apply_theme(self, theme_name, save=True):
         """Apply a theme to the application
         
         Args:
             theme_name: Name of the theme to apply
+            save: Whether to persist the selection to the config file
         """
         if theme_name not in self.themes:
             return
         
+        # Nothing to restyle or save if the theme is already active
+        if theme_name == self._applied_theme:
+            return
+        
         # Store current theme
         self.current_theme = theme_name
         
-        # Apply stylesheet
-        QApplication.instance().setStyleSheet(self.themes[theme_name])
+        self._apply_stylesheet(theme_name)
+        
+        # Write the config once control returns to the event loop, so the
+        # restyle is painted first and rapid toggles collapse into one write
+        if save and not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(0, self._flush_theme_config)
+    
+    def _flush_theme_config(self):
+        """Save the theme config scheduled by apply_theme"""
+        self._save_pending = False
+        self.save_theme_config()
+    
+    def _apply_stylesheet(self, theme_name):
+        """Set a theme's stylesheet on the application
+        
+        Args:
+            theme_name: Name of the theme
+        """
+        self._applied_theme = theme_name
+        
+        # Identical stylesheet text would only re-polish every widget
+        stylesheet = self.get_stylesheet(theme_name)
+        stylesheet_hash = hash(stylesheet)
+        if stylesheet_hash == self._last_applied_hash:
+            return
+        
+        if self._app is None:
+            self._app = QApplication.instance()
+        self._app.setStyleSheet(stylesheet)
+        self._last_applied_hash = stylesheet_hash
     
     def create_theme_toggle(self, parent=None):
         """Create a theme toggle switch widget
@@ -472,7 +481,7 @@ class ThemeManager:
         # Create toggle switch
         toggle = ThemeToggleSwitch(parent)
         toggle.setObjectName("theme-toggle")
-        toggle.setChecked(self.current_theme == "dark")
+        toggle.setChecked(self.current_theme == "dark", animate=False)
         toggle.toggled.connect(lambda checked: parent.toggle_theme())
         
         # Add widgets to layout
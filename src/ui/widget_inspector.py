@@ -1,7 +1,11 @@
+from html import escape
+
 from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QDialog, QScrollArea, QWidget
 from PyQt5.QtCore import Qt, QObject, QEvent
-from PyQt5.QtGui import QCursor, QKeySequence
-import inspect
+from PyQt5.QtGui import QCursor
+
+# Plain int for the per-event type comparison in the inspector's filter
+_MOUSE_BUTTON_PRESS = int(QEvent.MouseButtonPress)
 
 class WidgetInspector(QObject):
     def __init__(self, parent=None):
@@ -10,8 +14,8 @@ class WidgetInspector(QObject):
         self.original_cursor = None
         self.parent_window = parent
         
-        # Store original event filters
-        self.original_event_filter = parent.eventFilter if hasattr(parent, 'eventFilter') else None
+        # Declared property names per widget class
+        self._property_name_cache = {}
         
         # Create info dialog
         self.info_dialog = QDialog(parent)
@@ -48,17 +52,17 @@ class WidgetInspector(QObject):
             self.parent_window.removeEventFilter(self)
     
     def eventFilter(self, obj, event):
-        if self.active and event.type() == QEvent.MouseButtonPress:
+        # Runs for every event delivered to the window, so bail out first
+        if not self.active:
+            return False
+        
+        if event.type() == _MOUSE_BUTTON_PRESS:
             widget = QApplication.widgetAt(QCursor.pos())
             if widget:
                 self.inspect_widget(widget)
                 return True
         
-        # Call original event filter if it exists
-        if self.original_event_filter:
-            return self.original_event_filter(obj, event)
-        
-        return super().eventFilter(obj, event)
+        return False
     
     def inspect_widget(self, widget):
         # Build widget path
@@ -68,36 +72,41 @@ class WidgetInspector(QObject):
             path.append(f"{parent.__class__.__name__}({parent.objectName() or 'unnamed'})")
             parent = parent.parent()
         
-        # Get properties
+        # Get declared Qt properties, reading the names once per class
+        widget_class = type(widget)
+        names = self._property_name_cache.get(widget_class)
+        if names is None:
+            meta_object = widget.metaObject()
+            names = tuple(
+                meta_object.property(i).name()
+                for i in range(meta_object.propertyCount())
+            )
+            self._property_name_cache[widget_class] = names
+        
         properties = []
-        for name in dir(widget):
-            if name.startswith('_') or name in ('parent', 'children'):
-                continue
-            
+        for name in names:
             try:
-                attr = getattr(widget, name)
-                if callable(attr):
-                    continue
-                    
-                value = str(attr)
-                if len(value) > 100:
-                    value = value[:100] + "..."
-                    
-                properties.append(f"<b>{name}</b>: {value}")
+                value = str(widget.property(name))
             except Exception:
-                pass
+                continue
+            
+            if len(value) > 100:
+                value = value[:100] + "..."
+                
+            properties.append(f"<b>{name}</b>: {escape(value)}")
         
         # Build HTML content
+        geometry = widget.geometry()
         html = f"""<h2>Widget: {widget.__class__.__name__}</h2>
         <p><b>Object Name:</b> {widget.objectName() or 'unnamed'}</p>
-        <p><b>Geometry:</b> {widget.geometry().x()}, {widget.geometry().y()}, {widget.geometry().width()}x{widget.geometry().height()}</p>
+        <p><b>Geometry:</b> {geometry.x()}, {geometry.y()}, {geometry.width()}x{geometry.height()}</p>
         <p><b>Visible:</b> {widget.isVisible()}</p>
         <p><b>Enabled:</b> {widget.isEnabled()}</p>
         <p><b>Widget Path:</b> {' → '.join(reversed(path))}</p>
         <h3>Properties:</h3>
         <p>{'<br>'.join(properties)}</p>
         <h3>Style Sheet:</h3>
-        <pre>{widget.styleSheet()}</pre>
+        <pre>{escape(widget.styleSheet())}</pre>
         """
         
         self.info_content.setText(html)
@@ -2,7 +2,7 @@
 Action button widget for WinRegi application
 """
 from PyQt5.QtWidgets import QPushButton, QVBoxLayout, QLabel, QWidget
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt
 
 class ActionButton(QPushButton):
     """Enhanced button for actions with description"""
@@ -54,9 +54,6 @@ class ActionButton(QPushButton):
 class DetailedActionButton(QWidget):
     """Action button with title and description"""
     
-    # Signal emitted when button is clicked
-    clicked = pyqtSignal()
-    
     def __init__(self, title, description=None, action_type="default", parent=None):
         """Initialize detailed action button
         
@@ -85,25 +82,23 @@ class DetailedActionButton(QWidget):
         
         # Create button
         self.button = ActionButton(self.action_title, self.action_description, self.action_type)
-        self.button.clicked.connect(self.clicked.emit)
         layout.addWidget(self.button)
         
         # Create description label
         if self.action_description:
             self.description_label = QLabel(self.action_description)
             self.description_label.setObjectName("action-description")
-            self.description_label.setStyleSheet("color: #777; font-size: 11px;")
             self.description_label.setWordWrap(True)
             self.description_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
             # Limit description height to prevent overly tall buttons
             self.description_label.setMaximumHeight(40)
             layout.addWidget(self.description_label)
     
-    def setEnabled(self, enabled):
-        """Set whether the button is enabled
+    @property
+    def clicked(self):
+        """Clicked signal of the inner button
         
-        Args:
-            enabled: Whether the button should be enabled
+        Returns:
+            Bound clicked signal, connected to directly without a relay
         """
-        self.button.setEnabled(enabled)
-        super().setEnabled(enabled)
\ No newline at end of file
+        return self.button.clicked
@@ -8,6 +8,31 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon, QPixmap
 
+# Scaled category icons keyed by (path, size); None marks an unreadable path
+_ICON_CACHE = {}
+
+def _scaled_icon_pixmap(path, size):
+    """Load an icon file scaled to a square size, once per path and size
+    
+    Args:
+        path: Icon file path
+        size: Target width and height in pixels
+        
+    Returns:
+        Scaled pixmap, or None if the file could not be loaded
+    """
+    key = (path, size)
+    if key in _ICON_CACHE:
+        return _ICON_CACHE[key]
+    
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        scaled = None
+    else:
+        scaled = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    _ICON_CACHE[key] = scaled
+    return scaled
+
 class CategoryItem(QFrame):
     """Category item for category list"""
     
@@ -52,9 +77,9 @@ class CategoryItem(QFrame):
             # Set icon
             if isinstance(self.category_icon, str):
                 # Icon is a path or name
-                pixmap = QPixmap(self.category_icon)
-                if not pixmap.isNull():
-                    icon_label.setPixmap(pixmap.scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                pixmap = _scaled_icon_pixmap(self.category_icon, 24)
+                if pixmap is not None:
+                    icon_label.setPixmap(pixmap)
                 else:
                     # Use default icon or text
                     icon_label.setText(self.category_name[0])
@@ -77,14 +102,12 @@ class CategoryItem(QFrame):
         # Category name
         name_label = QLabel(self.category_name)
         name_label.setObjectName("category-name")
-        name_label.setStyleSheet("font-weight: bold; font-size: 12px;")  # Reduce font size
         text_layout.addWidget(name_label)
         
         # Category description - only show if there's enough space
         if self.category_description and len(self.category_description) < 40:  # Limit description length
             description_label = QLabel(self.category_description[:37] + "..." if len(self.category_description) > 37 else self.category_description)
             description_label.setObjectName("category-description")
-            description_label.setStyleSheet("color: #777; font-size: 10px;")  # Smaller font size
             text_layout.addWidget(description_label)
         
         # Add text layout to main layout
@@ -119,27 +142,41 @@ class CategoryList(QListWidget):
         # Connect signals
         self.itemClicked.connect(self.on_item_clicked)
     
-    def add_category(self, category_id, name, description=None, icon=None):
+    def add_category(self, category_id, name, description=None, icon=None, rich=False):
         """Add a category to the list
         
+        By default the row is rendered natively by the list from the item's
+        text, icon and tooltip. Pass rich=True to embed a CategoryItem widget
+        showing the description as a second line instead.
+        
         Args:
             category_id: Category ID
             name: Category name
             description: Category description (optional)
             icon: Category icon (optional)
+            rich: Whether to use a CategoryItem widget for the row
             
         Returns:
             Created list item
         """
         # Create list item
         item = QListWidgetItem(self)
+        item.setData(Qt.UserRole, category_id)
+        
+        if not rich:
+            # Native row, no per-item widgets or layouts
+            item.setText(name)
+            if description:
+                item.setToolTip(description)
+            if icon:
+                item.setIcon(icon if isinstance(icon, QIcon) else QIcon(icon))
+            return item
         
         # Create category widget
         category_widget = CategoryItem(category_id, name, description, icon)
         
         # Set item properties
         item.setSizeHint(category_widget.sizeHint())
-        item.setData(Qt.UserRole, category_id)
         
         # Add item to list
         self.addItem(item)
@@ -147,6 +184,23 @@ class CategoryList(QListWidget):
         
         return item
     
+    def add_categories(self, categories, rich=False):
+        """Add several categories with a single repaint
+        
+        Prefer this over repeated add_category calls when loading a
+        whole category set.
+        
+        Args:
+            categories: Iterable of (category_id, name, description, icon) tuples
+            rich: Whether to use CategoryItem widgets for the rows
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for category_id, name, description, icon in categories:
+                self.add_category(category_id, name, description, icon, rich)
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def clear_categories(self):
         """Clear all categories from the list"""
         self.clear()
@@ -1,20 +1,92 @@
 """
 Modern animated search bar widget for WinRegi application
 """
+from bisect import bisect_left
+
 from PyQt5.QtWidgets import (
     QWidget, QLineEdit, QPushButton, QHBoxLayout, 
     QVBoxLayout, QLabel, QCompleter, QListWidget,
-    QGraphicsDropShadowEffect, QSizePolicy, QFrame
+    QSizePolicy, QFrame,
+    QStyle, QStyleOptionButton, QStylePainter
 )
 from PyQt5.QtCore import (
-    Qt, pyqtSignal, QSize, QPropertyAnimation, 
-    QEasingCurve, QTimer, QRect, QPoint, pyqtProperty
+    Qt, pyqtSignal, QSize, QAbstractAnimation, QAbstractListModel, QModelIndex, QPropertyAnimation, QVariantAnimation,
+    QEasingCurve, QTimer, QRect, QRectF, QPoint, pyqtProperty
 )
-from PyQt5.QtGui import QIcon, QColor, QPainter, QPainterPath, QFont
+from PyQt5.QtGui import QIcon, QPainter, QPainterPath, QFont
+
+class _PrefixCompletionModel(QAbstractListModel):
+    """Completion model holding only the first matches for the typed prefix"""
+    
+    def __init__(self, items, max_matches=20, parent=None):
+        """Initialize prefix completion model
+        
+        Args:
+            items: Completion items
+            max_matches: Maximum number of suggestions shown at once
+            parent: Parent object
+        """
+        super().__init__(parent)
+        
+        # Sorted case-insensitively so matching a prefix is a binary search
+        self._items = sorted(items, key=str.lower)
+        self._keys = [item.lower() for item in self._items]
+        self._max_matches = max_matches
+        self._matches = []
+    
+    def set_prefix(self, prefix):
+        """Update the suggestions for a typed prefix
+        
+        Args:
+            prefix: Text typed so far
+        """
+        prefix = prefix.strip().lower()
+        matches = []
+        if prefix:
+            start = bisect_left(self._keys, prefix)
+            limit = min(len(self._keys), start + self._max_matches)
+            end = bisect_left(self._keys, prefix + "\uffff", start, limit)
+            matches = self._items[start:end]
+        
+        if matches != self._matches:
+            self.beginResetModel()
+            self._matches = matches
+            self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Get number of current suggestions
+        
+        Args:
+            parent: Parent index
+            
+        Returns:
+            Suggestion count
+        """
+        return 0 if parent.isValid() else len(self._matches)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Get suggestion text
+        
+        Args:
+            index: Model index
+            role: Data role
+            
+        Returns:
+            Suggestion text, or None for other roles
+        """
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._matches[index.row()]
+        return None
 
 class AnimatedButton(QPushButton):
     """Button with press animation effect"""
     
+    # Animation timing shared by every instance
+    _PRESS_DURATION_MS = 100
+    _PRESS_EASING = QEasingCurve(QEasingCurve.OutQuad)
+    _HOVER_DURATION_MS = 150
+    _HOVER_EASING = QEasingCurve(QEasingCurve.InOutQuad)
+    
     def __init__(self, text="", parent=None):
         """Initialize animated button
         
@@ -34,13 +106,17 @@ class AnimatedButton(QPushButton):
         
         # Create press animation
         self._press_animation = QPropertyAnimation(self, b"scale_factor")
-        self._press_animation.setDuration(100)
-        self._press_animation.setEasingCurve(QEasingCurve.OutQuad)
+        self._press_animation.setDuration(self._PRESS_DURATION_MS)
+        self._press_animation.setEasingCurve(self._PRESS_EASING)
+        self._press_animation.setStartValue(1.0)
+        self._press_animation.setEndValue(0.95)
+        self.pressed.connect(self._animate_press)
+        self.released.connect(self._animate_release)
         
         # Create hover animation
         self._hover_animation = QPropertyAnimation(self, b"hover_state")
-        self._hover_animation.setDuration(150)
-        self._hover_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self._hover_animation.setDuration(self._HOVER_DURATION_MS)
+        self._hover_animation.setEasingCurve(self._HOVER_EASING)
     
     def get_scale_factor(self):
         """Get scale factor property
@@ -102,54 +178,22 @@ class AnimatedButton(QPushButton):
         self.update()
         super().leaveEvent(event)
     
-    def mousePressEvent(self, event):
-        """Handle mouse press event
-        
-        Args:
-            event: Mouse event
-        """
-        if event and event.button() == Qt.LeftButton:
-            self._is_pressed = True
-            
-            # Start press animation
-            self._press_animation.setStartValue(1.0)
-            self._press_animation.setEndValue(0.95)
-            self._press_animation.start()
-            
-        super().mousePressEvent(event)
+    def _animate_press(self):
+        """Shrink the button while it is held down"""
+        self._press_animation.setDirection(QAbstractAnimation.Forward)
+        self._press_animation.start()
     
-    def mouseReleaseEvent(self, event):
-        """Handle mouse release event
-        
-        Args:
-            event: Mouse event
-        """
-        if event and event.button() == Qt.LeftButton and self._is_pressed:
-            self._is_pressed = False
-            
-            # Start release animation
-            self._press_animation.setStartValue(0.95)
-            self._press_animation.setEndValue(1.0)
-            self._press_animation.start()
-            
-        super().mouseReleaseEvent(event)
+    def _animate_release(self):
+        """Restore the button size after release"""
+        self._press_animation.setDirection(QAbstractAnimation.Backward)
+        self._press_animation.start()
     
     def simulate_click(self):
         """Simulate a button click with animation"""
-        # Start press animation
-        self._press_animation.setStartValue(1.0)
-        self._press_animation.setEndValue(0.95)
-        self._press_animation.start()
+        self._animate_press()
         
         # Schedule release animation
-        QTimer.singleShot(100, lambda: self._simulate_release())
-    
-    def _simulate_release(self):
-        """Simulate button release part of the animation"""
-        # Start release animation
-        self._press_animation.setStartValue(0.95)
-        self._press_animation.setEndValue(1.0)
-        self._press_animation.start()
+        QTimer.singleShot(100, self._animate_release)
     
     def paintEvent(self, event):
         """Custom paint event to apply scale transform
@@ -157,27 +201,32 @@ class AnimatedButton(QPushButton):
         Args:
             event: Paint event
         """
-        # Save painter state
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Unscaled buttons take the regular stylesheet paint path
+        if self._scale_factor == 1.0:
+            super().paintEvent(event)
+            return
         
-        # Scale the button
-        painter.save()
+        painter = QStylePainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
         
-        # Apply scale transform
-        painter.translate(self.rect().center())
+        # Apply scale transform around the button center
+        center = QRectF(self.rect()).center()
+        painter.translate(center)
         painter.scale(self._scale_factor, self._scale_factor)
-        painter.translate(-self.rect().center())
-        
-        # Draw button
-        super().paintEvent(event)
+        painter.translate(-center)
         
-        # Restore painter state
-        painter.restore()
+        # Draw button through the same painter so the transform applies
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        painter.drawControl(QStyle.CE_PushButton, option)
 
 class ExampleButton(QPushButton):
     """Pill-shaped example button with hover animation"""
     
+    # Animation timing shared by every instance
+    _HOVER_DURATION_MS = 200
+    _HOVER_EASING = QEasingCurve(QEasingCurve.InOutQuad)
+    
     def __init__(self, text, parent=None):
         """Initialize example button
         
@@ -195,10 +244,12 @@ class ExampleButton(QPushButton):
         # Initialize hover value
         self._hover_value = 0.0
         
-        # Create hover animation
-        self._hover_animation = QPropertyAnimation(self, b"hover_value")
-        self._hover_animation.setDuration(200)
-        self._hover_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        # Create hover animation, owned by the button so Qt frees it with the widget
+        self._hover_animation = QPropertyAnimation(self, b"hover_value", self)
+        self._hover_animation.setDuration(self._HOVER_DURATION_MS)
+        self._hover_animation.setEasingCurve(self._HOVER_EASING)
+        self._hover_animation.setStartValue(0.0)
+        self._hover_animation.setEndValue(1.0)
     
     def get_hover_value(self):
         """Get hover value
@@ -228,8 +279,7 @@ class ExampleButton(QPushButton):
             event: Enter event
         """
         # Start hover animation
-        self._hover_animation.setStartValue(0.0)
-        self._hover_animation.setEndValue(1.0)
+        self._hover_animation.setDirection(QAbstractAnimation.Forward)
         self._hover_animation.start()
         
         super().enterEvent(event)
@@ -241,21 +291,10 @@ class ExampleButton(QPushButton):
             event: Leave event
         """
         # Start hover animation
-        self._hover_animation.setStartValue(1.0)
-        self._hover_animation.setEndValue(0.0)
+        self._hover_animation.setDirection(QAbstractAnimation.Backward)
         self._hover_animation.start()
         
         super().leaveEvent(event)
-    
-    def paintEvent(self, event):
-        """Custom paint event with hover effect
-        
-        Args:
-            event: Paint event
-        """
-        # Use default paint event for now
-        # Can be customized further if needed
-        super().paintEvent(event)
 
 class SearchBar(QWidget):
     """Modern search bar widget with AI-powered search functionality"""
@@ -273,6 +312,26 @@ class SearchBar(QWidget):
         
         # Initialize state
         self._is_expanded = False
+        self._target_text = ""
+        self._completion_model = None
+        
+        # Typing effect for example queries, driven by a single animation
+        self._typing_animation = QVariantAnimation(self)
+        self._typing_animation.valueChanged.connect(self.on_typing_progress)
+        self._typing_animation.finished.connect(self.on_typing_finished)
+        
+        # Pause between the typed example and its search, cancelled by a new example
+        self._example_search_timer = QTimer(self)
+        self._example_search_timer.setSingleShot(True)
+        self._example_search_timer.setInterval(300)
+        self._example_search_timer.timeout.connect(self.on_search)
+        
+        # Coalesces repeated Enter presses and clicks into one search request
+        self._pending_query = ""
+        self._search_debounce_timer = QTimer(self)
+        self._search_debounce_timer.setSingleShot(True)
+        self._search_debounce_timer.setInterval(150)
+        self._search_debounce_timer.timeout.connect(self._emit_search)
         
         # Set up UI
         self.init_ui()
@@ -300,13 +359,6 @@ class SearchBar(QWidget):
         search_container.setMinimumHeight(56)
         search_container.setProperty("class", "search-container")
         
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 3)
-        search_container.setGraphicsEffect(shadow)
-        
         # Create search bar layout
         search_layout = QHBoxLayout(search_container)
         search_layout.setContentsMargins(20, 0, 20, 0)
@@ -370,7 +422,7 @@ class SearchBar(QWidget):
         # Add example buttons
         for example in examples:
             example_button = ExampleButton(example)
-            example_button.clicked.connect(lambda checked, text=example: self.use_example(text))
+            example_button.clicked.connect(self.on_example_clicked)
             examples_buttons_layout.addWidget(example_button)
         
         # Add stretch to ensure buttons don't expand too much
@@ -388,6 +440,10 @@ class SearchBar(QWidget):
         # Set focus to search input
         self.search_input.setFocus()
     
+    def on_example_clicked(self):
+        """Handle example button click, shared by every example button"""
+        self.use_example(self.sender().text())
+    
     def use_example(self, example_text):
         """Use an example query with animation
         
@@ -395,31 +451,32 @@ class SearchBar(QWidget):
             example_text: Example query text
         """
         # Set text with typing effect
+        self._typing_animation.stop()
+        self._example_search_timer.stop()
         self.search_input.clear()
         self.search_input.setFocus()
         
-        # Schedule delayed typing effect
-        self._current_text = ""
+        # Animate the number of typed characters
         self._target_text = example_text
-        self._type_index = 0
-        
-        # Start typing
-        QTimer.singleShot(100, self.type_next_character)
-    
-    def type_next_character(self):
-        """Type next character in the example text"""
-        if self._type_index < len(self._target_text):
-            # Add next character
-            self._current_text += self._target_text[self._type_index]
-            self.search_input.setText(self._current_text)
-            self.search_input.setCursorPosition(len(self._current_text))
-            
-            # Schedule next character
-            self._type_index += 1
-            QTimer.singleShot(30, self.type_next_character)
-        else:
-            # Typing complete, trigger search
-            QTimer.singleShot(300, self.on_search)
+        self._typing_animation.setDuration(min(600, 30 * len(example_text)))
+        self._typing_animation.setStartValue(0)
+        self._typing_animation.setEndValue(len(example_text))
+        self._typing_animation.start()
+    
+    def on_typing_progress(self, count):
+        """Show the typed prefix of the example text
+        
+        Args:
+            count: Number of characters typed so far
+        """
+        text = self._target_text[:int(count)]
+        if text != self.search_input.text():
+            self.search_input.setText(text)
+    
+    def on_typing_finished(self):
+        """Handle the end of the typing effect"""
+        # Typing complete, trigger search
+        self._example_search_timer.start()
     
     def set_completer(self, items):
         """Set completer for search input
@@ -427,9 +484,16 @@ class SearchBar(QWidget):
         Args:
             items: List of completion items
         """
-        completer = QCompleter(items, self)
+        if self._completion_model is not None:
+            self.search_input.textEdited.disconnect(self._completion_model.set_prefix)
+        
+        # The model narrows suggestions itself, so the completer shows it unfiltered
+        self._completion_model = _PrefixCompletionModel(items, parent=self)
+        self.search_input.textEdited.connect(self._completion_model.set_prefix)
+        
+        completer = QCompleter(self._completion_model, self)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
         completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchContains)
         self.search_input.setCompleter(completer)
     
     def on_search(self):
@@ -442,8 +506,13 @@ class SearchBar(QWidget):
             except Exception as e:
                 print(f"Button animation error (ignoring): {e}")
             
-            # Emit search signal after slight delay for better UX
-            self.search_requested.emit(query)
+            # Debounce: emit 150 ms after the last submit, so repeated clicks search once
+            self._pending_query = query
+            self._search_debounce_timer.start()
+    
+    def _emit_search(self):
+        """Emit the most recent pending search query"""
+        self.search_requested.emit(self._pending_query)
     
     def get_query(self):
         """Get the current search query
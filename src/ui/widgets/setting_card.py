@@ -1,183 +1,145 @@
 """
-Modern setting card widget for WinRegi application with animations and effects
+Modern setting card widget for WinRegi application with animations
 """
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QHBoxLayout, 
-    QVBoxLayout, QFrame, QSizePolicy, QGraphicsDropShadowEffect,
-    QGraphicsOpacityEffect
+    QVBoxLayout, QFrame
 )
 from PyQt5.QtCore import (
-    Qt, pyqtSignal, QSize, QPropertyAnimation, 
-    QEasingCurve, QTimer, QRect, QPoint, pyqtProperty
+    Qt, pyqtSignal, QObject, QElapsedTimer,
+    QEasingCurve, QTimer, QRect, pyqtProperty
 )
-from PyQt5.QtGui import QIcon, QPixmap, QColor, QFont, QPainter, QPainterPath
+from PyQt5.QtGui import QFont, QPainter, QPixmap
 
-class AnimatedButton(QPushButton):
-    """Button with hover, press and click animations"""
-    
-    def __init__(self, text="", parent=None):
-        """Initialize animated button
-        
-        Args:
-            text: Button text
-            parent: Parent widget
-        """
-        super().__init__(text, parent)
-        
-        # Set cursor to pointing hand
-        self.setCursor(Qt.PointingHandCursor)
-        
-        # Initialize state
-        self._scale_factor = 1.0
-        self._hover_opacity = 0.0
-        self._is_pressed = False
-        
-        # Create scale animation
-        self._scale_animation = QPropertyAnimation(self, b"scale_factor")
-        self._scale_animation.setDuration(100)
-        self._scale_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        # Create hover animation
-        self._hover_animation = QPropertyAnimation(self, b"hover_opacity")
-        self._hover_animation.setDuration(150)
-        self._hover_animation.setEasingCurve(QEasingCurve.InOutQuad)
-    
-    def get_scale_factor(self):
-        """Get scale factor property
-        
-        Returns:
-            Current scale factor
-        """
-        return self._scale_factor
-    
-    def set_scale_factor(self, factor):
-        """Set scale factor property
-        
-        Args:
-            factor: New scale factor
-        """
-        self._scale_factor = factor
-        self.update()
-    
-    # Define property for scale animation
-    scale_factor = pyqtProperty(float, get_scale_factor, set_scale_factor)
+# Badge emoji per setting category
+_CATEGORY_ICONS = {
+    "System": "⚙️",
+    "Display": "🖥️",
+    "Network": "🌐",
+    "Privacy": "🔒",
+    "Security": "🛡️",
+    "Performance": "⚡",
+    "Power": "🔋",
+    "Apps": "📱",
+    "Updates": "🔄",
+    "Storage": "💾"
+}
+
+# Badge emoji for settings without a known category
+_DEFAULT_CATEGORY_ICON = "⚙️"
+
+# Rendered badge emoji keyed by (emoji, device pixel ratio)
+_BADGE_PIXMAPS = {}
+
+_BADGE_SIZE = 40
+
+def _badge_pixmap(icon, dpr):
+    """Get a category emoji rendered once at badge size
     
-    def get_hover_opacity(self):
-        """Get hover opacity property
-        
-        Returns:
-            Current hover opacity
-        """
-        return self._hover_opacity
+    Args:
+        icon: Emoji text to render
+        dpr: Device pixel ratio of the target screen
+        
+    Returns:
+        Cached QPixmap with the centered emoji
+    """
+    key = (icon, dpr)
+    pixmap = _BADGE_PIXMAPS.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(_BADGE_SIZE * dpr), round(_BADGE_SIZE * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        font = QFont()
+        font.setPixelSize(24)
+        
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, _BADGE_SIZE, _BADGE_SIZE), Qt.AlignCenter, icon)
+        painter.end()
+        
+        _BADGE_PIXMAPS[key] = pixmap
+    return pixmap
+
+# Card fonts keyed by (point size, weight), built after the application exists
+_FONT_CACHE = {}
+
+def _card_font(point_size, weight=QFont.Normal):
+    """Get a shared Segoe UI font for card labels
     
-    def set_hover_opacity(self, opacity):
-        """Set hover opacity property
-        
-        Args:
-            opacity: New hover opacity
-        """
-        self._hover_opacity = opacity
-        self.update()
+    Args:
+        point_size: Font point size
+        weight: Font weight
+        
+    Returns:
+        Cached QFont instance
+    """
+    key = (point_size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = QFont("Segoe UI", point_size, weight)
+    return font
+
+class _SharedAnimator(QObject):
+    """Single timer animating one float property across many widgets
     
-    # Define property for hover animation
-    hover_opacity = pyqtProperty(float, get_hover_opacity, set_hover_opacity)
+    Widgets register a target value with animate(); the timer only runs
+    while at least one widget is still moving towards its target.
+    """
     
-    def enterEvent(self, event):
-        """Handle mouse enter event
+    def __init__(self, duration, easing, getter, setter):
+        """Initialize shared animator
         
         Args:
-            event: Enter event
+            duration: Animation duration in milliseconds
+            easing: QEasingCurve applied to progress
+            getter: Function returning a widget's current value
+            setter: Function applying a new value to a widget
         """
-        # Start hover animation
-        self._hover_animation.stop()
-        self._hover_animation.setStartValue(self._hover_opacity)
-        self._hover_animation.setEndValue(1.0)
-        self._hover_animation.start()
-        
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        """Handle mouse leave event
+        super().__init__()
         
-        Args:
-            event: Leave event
-        """
-        # Start hover animation
-        self._hover_animation.stop()
-        self._hover_animation.setStartValue(self._hover_opacity)
-        self._hover_animation.setEndValue(0.0)
-        self._hover_animation.start()
+        self._duration = duration
+        self._easing = QEasingCurve(easing)
+        self._getter = getter
+        self._setter = setter
         
-        super().leaveEvent(event)
-    
-    def mousePressEvent(self, event):
-        """Handle mouse press event
+        # Animating widgets mapped to (start value, end value, start time)
+        self._active = {}
         
-        Args:
-            event: Mouse event
-        """
-        if event.button() == Qt.LeftButton:
-            self._is_pressed = True
-            
-            # Start press animation
-            self._scale_animation.stop()
-            self._scale_animation.setStartValue(self._scale_factor)
-            self._scale_animation.setEndValue(0.95)
-            self._scale_animation.start()
+        self._clock = QElapsedTimer()
+        self._clock.start()
         
-        super().mousePressEvent(event)
+        self._timer = QTimer(self)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._tick)
     
-    def mouseReleaseEvent(self, event):
-        """Handle mouse release event
+    def animate(self, widget, end_value):
+        """Animate a widget from its current value to end_value
         
         Args:
-            event: Mouse event
+            widget: Widget to animate
+            end_value: Target value
         """
-        if event.button() == Qt.LeftButton and self._is_pressed:
-            self._is_pressed = False
-            
-            # Start release animation
-            self._scale_animation.stop()
-            self._scale_animation.setStartValue(self._scale_factor)
-            self._scale_animation.setEndValue(1.0)
-            self._scale_animation.start()
-        
-        super().mouseReleaseEvent(event)
+        self._active[widget] = (self._getter(widget), end_value, self._clock.elapsed())
+        if not self._timer.isActive():
+            self._timer.start()
     
-    def paintEvent(self, event):
-        """Custom paint event with animation effects
-        
-        Args:
-            event: Paint event
-        """
-        # Create painter
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Save state
-        painter.save()
-        
-        # Apply scale transform if pressed
-        painter.translate(self.rect().center())
-        painter.scale(self._scale_factor, self._scale_factor)
-        painter.translate(-self.rect().center())
-        
-        # Draw button (base class implementation)
-        super().paintEvent(event)
-        
-        # Draw hover overlay if hovered
-        if self._hover_opacity > 0:
-            # Create a semi-transparent overlay
-            painter.setOpacity(self._hover_opacity * 0.1)
-            
-            if self.property("class") == "primary-action":
-                painter.fillRect(self.rect(), QColor("#ffffff"))
-            else:
-                # Different hover effect for secondary buttons
-                painter.fillRect(self.rect(), QColor("#000000"))
-        
-        # Restore state
-        painter.restore()
+    def _tick(self):
+        """Advance every active animation by one frame"""
+        now = self._clock.elapsed()
+        for widget, (start_value, end_value, start_time) in list(self._active.items()):
+            progress = min(1.0, (now - start_time) / self._duration)
+            value = start_value + (end_value - start_value) * self._easing.valueForProgress(progress)
+            try:
+                self._setter(widget, value)
+            except RuntimeError:
+                # Widget was deleted while animating
+                progress = 1.0
+            if progress >= 1.0:
+                del self._active[widget]
+        
+        if not self._active:
+            self._timer.stop()
 
 class SettingCard(QFrame):
     """Modern card widget displaying a Windows setting with animations"""
@@ -188,6 +150,11 @@ class SettingCard(QFrame):
     # Signal emitted when action button is clicked
     action_requested = pyqtSignal(int)
     
+    # Hover animation timing and its animator, created on first hover
+    _HOVER_DURATION_MS = 200
+    _HOVER_EASING = QEasingCurve(QEasingCurve.InOutQuad)
+    _hover_animator = None
+    
     def __init__(self, setting_id, name, description, category=None, parent=None):
         """Initialize setting card widget
         
@@ -215,32 +182,34 @@ class SettingCard(QFrame):
         self.setObjectName("setting-card")
         self.setProperty("class", "setting-card")
         
-        # Add shadow effect
-        self.shadow = QGraphicsDropShadowEffect()
-        self.shadow.setBlurRadius(15)
-        self.shadow.setColor(QColor(0, 0, 0, 40))
-        self.shadow.setOffset(0, 3)
-        self.setGraphicsEffect(self.shadow)
-        
-        # Add mouse tracking for hover effects
-        self.setMouseTracking(True)
-        
         # Initialize animation properties
         self._hover_state = 0.0
         self._y_offset = 0.0
-
-        # Store the original y position
-        self._original_y = None
-        
-        # Create hover animation
-        self._hover_animation = QPropertyAnimation(self, b"hover_state")
-        self._hover_animation.setDuration(200)
-        self._hover_animation.setEasingCurve(QEasingCurve.InOutQuad)
-        
-        # Create elevation animation
-        self._elevation_animation = QPropertyAnimation(self, b"y_offset")
-        self._elevation_animation.setDuration(200)
-        self._elevation_animation.setEasingCurve(QEasingCurve.OutCubic)
+        
+        # Whole pixels the card content is currently lifted by
+        self._lift = 0
+    
+    def _animate_hover(self, end_value):
+        """Animate hover state and elevation towards a target
+        
+        Args:
+            end_value: Target hover state (0.0 or 1.0)
+        """
+        if SettingCard._hover_animator is None:
+            SettingCard._hover_animator = _SharedAnimator(
+                SettingCard._HOVER_DURATION_MS, SettingCard._HOVER_EASING,
+                SettingCard.get_hover_state, SettingCard._set_hover_progress
+            )
+        SettingCard._hover_animator.animate(self, end_value)
+    
+    def _set_hover_progress(self, state):
+        """Apply hover state and the matching elevation
+        
+        Args:
+            state: New hover state
+        """
+        self.set_hover_state(state)
+        self.set_y_offset(state * 3.0)
     
     def get_hover_state(self):
         """Get hover state property
@@ -257,17 +226,6 @@ class SettingCard(QFrame):
             state: New hover state
         """
         self._hover_state = state
-        
-        # Update shadow blur radius and color based on hover state
-        self.shadow.setBlurRadius(15 + self._hover_state * 10)
-        
-        # Interpolate shadow opacity
-        base_opacity = 40
-        hover_opacity = 80
-        opacity = int(base_opacity + self._hover_state * (hover_opacity - base_opacity))
-        self.shadow.setColor(QColor(0, 0, 0, opacity))
-        
-        self.update()
     
     # Define property for hover animation
     hover_state = pyqtProperty(float, get_hover_state, set_hover_state)
@@ -286,16 +244,16 @@ class SettingCard(QFrame):
         Args:
             offset: New Y offset
         """
-        # Store value and convert to int if needed
+        # Store value; the layout shift uses whole pixels
         self._y_offset = offset
-        offset = int(offset)
-        
-        # Store original position if not already stored
-        if self._original_y is None:
-            self._original_y = self.y()
-        
-        # Apply offset transform by moving the widget relative to original position
-        self.move(self.x(), self._original_y - offset)
+        lift = int(offset)
+        if lift == self._lift:
+            return
+        self._lift = lift
+        
+        # Lift the content inside the card; the total margin is unchanged, so
+        # the card's size hint and its position in the parent layout stay put
+        self.layout().setContentsMargins(20, 20 - lift, 20, 20 + lift)
     
     # Define property for elevation animation
     y_offset = pyqtProperty(float, get_y_offset, set_y_offset)
@@ -314,29 +272,15 @@ class SettingCard(QFrame):
         # Create category icon/badge
         self.category_badge = QLabel()
         self.category_badge.setObjectName("category-badge")
-        self.category_badge.setFixedSize(40, 40)
+        self.category_badge.setFixedSize(_BADGE_SIZE, _BADGE_SIZE)
         self.category_badge.setAlignment(Qt.AlignCenter)
         
         # Set icon based on category (using emoji as fallback)
-        category_icons = {
-            "System": "⚙️",
-            "Display": "🖥️",
-            "Network": "🌐",
-            "Privacy": "🔒",
-            "Security": "🛡️",
-            "Performance": "⚡",
-            "Power": "🔋",
-            "Apps": "📱",
-            "Updates": "🔄",
-            "Storage": "💾"
-        }
-        
-        if self.setting_category in category_icons:
-            self.category_badge.setText(category_icons.get(self.setting_category, "⚙️"))
+        if self.setting_category:
+            icon = _CATEGORY_ICONS.get(self.setting_category, _DEFAULT_CATEGORY_ICON)
         else:
-            self.category_badge.setText("⚙️")
-        
-        self.category_badge.setStyleSheet("font-size: 24px; background-color: #f5f9ff; border-radius: 20px;")
+            icon = _DEFAULT_CATEGORY_ICON
+        self.category_badge.setPixmap(_badge_pixmap(icon, self.category_badge.devicePixelRatioF()))
         
         icon_layout.addWidget(self.category_badge)
         layout.addLayout(icon_layout)
@@ -348,7 +292,7 @@ class SettingCard(QFrame):
         # Setting name with custom font
         self.name_label = QLabel(self.setting_name)
         self.name_label.setObjectName("setting-name")
-        self.name_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.name_label.setFont(_card_font(12, QFont.Bold))
         
         content_layout.addWidget(self.name_label)
         
@@ -357,7 +301,7 @@ class SettingCard(QFrame):
             self.description_label = QLabel(self.setting_description)
             self.description_label.setObjectName("setting-description")
             self.description_label.setWordWrap(True)
-            self.description_label.setFont(QFont("Segoe UI", 10))
+            self.description_label.setFont(_card_font(10))
             
             content_layout.addWidget(self.description_label)
         
@@ -373,7 +317,7 @@ class SettingCard(QFrame):
             
             self.category_label = QLabel(self.setting_category)
             self.category_label.setObjectName("setting-category")
-            self.category_label.setFont(QFont("Segoe UI", 9, QFont.Bold))
+            self.category_label.setFont(_card_font(9, QFont.Bold))
             
             category_layout.addWidget(self.category_label)
             content_layout.addWidget(category_container)
@@ -387,7 +331,7 @@ class SettingCard(QFrame):
         button_layout.setSpacing(8)
         
         # Details button
-        self.details_button = AnimatedButton("Details")
+        self.details_button = QPushButton("Details")
         self.details_button.setObjectName("setting-details")
         self.details_button.setProperty("class", "action-button")
         self.details_button.setCursor(Qt.PointingHandCursor)
@@ -395,7 +339,7 @@ class SettingCard(QFrame):
         self.details_button.setMinimumHeight(36)
         
         # Action button
-        self.action_button = AnimatedButton("Apply")
+        self.action_button = QPushButton("Apply")
         self.action_button.setObjectName("setting-action")
         self.action_button.setProperty("class", "primary-action")
         self.action_button.setCursor(Qt.PointingHandCursor)
@@ -422,17 +366,8 @@ class SettingCard(QFrame):
         Args:
             event: Mouse event
         """
-        # Start hover animation
-        self._hover_animation.stop()
-        self._hover_animation.setStartValue(self._hover_state)
-        self._hover_animation.setEndValue(1.0)
-        self._hover_animation.start()
-        
-        # Start elevation animation
-        self._elevation_animation.stop()
-        self._elevation_animation.setStartValue(self._y_offset)
-        self._elevation_animation.setEndValue(3.0)
-        self._elevation_animation.start()
+        # Start hover and elevation animation
+        self._animate_hover(1.0)
         
         # Change cursor to pointing hand
         self.setCursor(Qt.PointingHandCursor)
@@ -445,17 +380,8 @@ class SettingCard(QFrame):
         Args:
             event: Mouse event
         """
-        # Start hover animation
-        self._hover_animation.stop()
-        self._hover_animation.setStartValue(self._hover_state)
-        self._hover_animation.setEndValue(0.0)
-        self._hover_animation.start()
-        
-        # Start elevation animation
-        self._elevation_animation.stop()
-        self._elevation_animation.setStartValue(self._y_offset)
-        self._elevation_animation.setEndValue(0.0)
-        self._elevation_animation.start()
+        # Start hover and elevation animation
+        self._animate_hover(0.0)
         
         # Reset cursor
         self.setCursor(Qt.ArrowCursor)
@@ -469,7 +395,6 @@ class SettingCard(QFrame):
             event: Mouse event
         """
         if event.button() == Qt.LeftButton:
-            # Apply press-and-release animation
             self.setCursor(Qt.PointingHandCursor)
             
             # Emit clicked signal
@@ -3,11 +3,130 @@ Command manager for WinRegi application
 Handles execution of custom commands
 """
 import os
+import atexit
+import hashlib
 import subprocess
 import tempfile
+import threading
 import sys
 import re
+import shutil
+import weakref
 import winreg
+from collections import OrderedDict
+
+# Registry root key names accepted in registry commands
+_HIVE_MAP = {
+    "HKCU": winreg.HKEY_CURRENT_USER,
+    "HKLM": winreg.HKEY_LOCAL_MACHINE,
+    "HKCR": winreg.HKEY_CLASSES_ROOT,
+    "HKU": winreg.HKEY_USERS,
+    "HKCC": winreg.HKEY_CURRENT_CONFIG
+}
+
+_VALID_ROOTS = tuple(_HIVE_MAP)
+
+# Registry command shape: path=value or path-
+_REG_COMMAND_RE = re.compile(r"^[A-Za-z0-9\\:_]+[=\\-].*$")
+
+# Characters that mark the last path element as a value name
+_VALUE_NAME_CHAR_RE = re.compile(r'[^A-Za-z0-9_\-]')
+
+# Operations refused by validate_command, per command type
+_DANGEROUS_SYSTEM = ("format", "rm -rf", "deltree", "del /s", "del /q")
+_DANGEROUS_POWERSHELL = ("Remove-Item -Recurse -Force", "Format-Volume", "Clear-")
+_DANGEROUS_BATCH = ("format", "rmdir /s", "del /s", "del /q", "rd /s")
+
+def _parse_reg_value(value):
+    """Pick the registry type for a command value (simple heuristic)
+    
+    Args:
+        value: Value text from a registry command
+        
+    Returns:
+        Tuple of (winreg value type, data to write)
+    """
+    if value.isdigit():
+        # Integer
+        return winreg.REG_DWORD, int(value)
+    if value.startswith("0x"):
+        # Hex value
+        return winreg.REG_DWORD, int(value, 16)
+    # String
+    return winreg.REG_SZ, value
+
+# Maximum number of registry key handles kept open between commands
+_KEY_CACHE_SIZE = 64
+
+# Windows errors meaning a key handle is no longer usable:
+# ERROR_INVALID_HANDLE and ERROR_KEY_DELETED
+_STALE_KEY_ERRORS = (6, 1018)
+
+# Live command managers, whose cached key handles are closed at exit
+_MANAGERS = weakref.WeakSet()
+
+def _close_all_registry_keys():
+    """Close the cached registry key handles of every live command manager"""
+    for manager in list(_MANAGERS):
+        manager.close_registry_keys()
+
+atexit.register(_close_all_registry_keys)
+
+# Private directory holding this process's batch files, created on first use
+_batch_dir = None
+_batch_lock = threading.Lock()
+
+def _get_batch_dir():
+    """Get the directory for batch files, creating it on first use
+    
+    The directory is private to this process and removed at exit, so
+    no other process can place or change the scripts run from it.
+    
+    Returns:
+        Path of the batch file directory
+    """
+    global _batch_dir
+    if _batch_dir is None:
+        _batch_dir = tempfile.mkdtemp(prefix="winregi_")
+        atexit.register(shutil.rmtree, _batch_dir, ignore_errors=True)
+    return _batch_dir
+
+def _run_captured(args, shell=False):
+    """Run a process to completion and capture its output
+    
+    Args:
+        args: Command line or argument list
+        shell: Whether to run through the shell
+        
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    process = subprocess.Popen(
+        args,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    with process:
+        stdout, stderr = process.communicate()
+        return process.returncode, stdout, stderr
+
+def _combine_output(stdout, stderr):
+    """Combine stdout and stderr into one output string
+    
+    Args:
+        stdout: Captured standard output
+        stderr: Captured standard error
+        
+    Returns:
+        Combined output
+    """
+    if not stderr:
+        return stdout
+    if not stdout:
+        return stderr
+    return stdout + "\n" + stderr
 
 class CommandManager:
     """Manages execution of custom commands"""
@@ -20,6 +139,10 @@ class CommandManager:
         """
         self.db_manager = db_manager
         
+        # Open registry key handles, least recently used first
+        self._key_cache = OrderedDict()
+        _MANAGERS.add(self)
+        
         # Define available command types
         self._command_types = {
             "system": "System Command",
@@ -57,7 +180,111 @@ class CommandManager:
             # Non-critical error, can continue
             print(f"Failed to update command usage: {e}")
         
-        # Dispatch to appropriate handler
+        return self._dispatch_command(command)
+    
+    def execute_commands_batch(self, command_ids):
+        """Execute several commands in order, sharing registry key handles
+        
+        Consecutive registry edits that target the same key are applied
+        through a single open handle. Pending edits are always applied
+        before the next command that cannot join them, so every command
+        sees the effects of the ones before it.
+        
+        Args:
+            command_ids: IDs of the commands to execute, in order
+            
+        Returns:
+            List of (command_id, success, output) tuples in input order
+        """
+        results = []
+        group = []
+        group_target = None
+        
+        # Fetch every command and record their use in one query each
+        commands = self.db_manager.get_commands_by_ids(command_ids)
+        try:
+            self.db_manager.update_commands_usage(list(commands))
+        except Exception as e:
+            # Non-critical error, can continue
+            print(f"Failed to update command usage: {e}")
+        
+        for command_id in command_ids:
+            command = commands.get(command_id)
+            edit = None
+            if command and command["command_type"] == "registry":
+                try:
+                    edit = self._parse_registry_command(command["command_value"])
+                except ValueError:
+                    # Let _dispatch_command report the parse error in order
+                    edit = None
+            
+            # Key deletion works on the parent hive, not an open key
+            if edit is not None and not (edit[5] and not edit[3]):
+                target = (edit[1], edit[2].lower())
+                if target != group_target:
+                    results.extend(self._apply_registry_group(group))
+                    group = []
+                    group_target = target
+                group.append((command_id, edit))
+                continue
+            
+            # Apply pending edits before running anything that cannot join them
+            results.extend(self._apply_registry_group(group))
+            group = []
+            group_target = None
+            
+            if not command:
+                results.append((command_id, False, "Command not found"))
+            else:
+                results.append((command_id, *self._dispatch_command(command)))
+        
+        results.extend(self._apply_registry_group(group))
+        return results
+    
+    def _apply_registry_group(self, edits):
+        """Apply registry edits that target one key through a shared handle
+        
+        Args:
+            edits: List of (command_id, edit) pairs for the same key, in order
+            
+        Returns:
+            List of (command_id, success, output) tuples in input order
+        """
+        if not edits:
+            return []
+        
+        path, root_key, subkey_path, value_name, value, delete = edits[0][1]
+        try:
+            key = self._open_key(root_key, subkey_path)
+        except PermissionError:
+            return [(command_id, False, "Permission denied. Try running as administrator.") for command_id, _ in edits]
+        except Exception as e:
+            return [(command_id, False, str(e)) for command_id, _ in edits]
+        
+        results = []
+        for command_id, edit in edits:
+            try:
+                success, output = self._apply_registry_edit(key, edit)
+            except OSError:
+                key, (success, output) = self._retry_registry_edit(edit)
+            results.append((command_id, success, output))
+            
+            if key is None:
+                # The key could not be reopened; the remaining edits fail the same way
+                results.extend((other_id, False, output) for other_id, _ in edits[len(results):])
+                break
+        
+        return results
+    
+    def _dispatch_command(self, command):
+        """Run a command with the handler for its type
+        
+        Args:
+            command: Command dictionary
+            
+        Returns:
+            Tuple of (success, output)
+        """
         cmd_type = command["command_type"]
         cmd_value = command["command_value"]
         
@@ -88,9 +315,9 @@ class CommandManager:
                 return False, "Command cannot be empty"
                 
             # Check for potentially dangerous commands
-            dangerous_commands = ["format", "rm -rf", "deltree", "del /s", "del /q"]
-            for dangerous in dangerous_commands:
-                if dangerous in cmd_value.lower():
+            lowered = cmd_value.lower()
+            for dangerous in _DANGEROUS_SYSTEM:
+                if dangerous in lowered:
                     return False, f"Command contains potentially dangerous operation: {dangerous}"
                     
             return True, ""
@@ -101,8 +328,7 @@ class CommandManager:
                 return False, "PowerShell script cannot be empty"
                 
             # Check for potentially dangerous commands
-            dangerous_commands = ["Remove-Item -Recurse -Force", "Format-Volume", "Clear-"]
-            for dangerous in dangerous_commands:
+            for dangerous in _DANGEROUS_POWERSHELL:
                 if dangerous in cmd_value:
                     return False, f"Script contains potentially dangerous operation: {dangerous}"
                     
@@ -114,9 +340,9 @@ class CommandManager:
                 return False, "Batch script cannot be empty"
                 
             # Check for potentially dangerous commands
-            dangerous_commands = ["format", "rmdir /s", "del /s", "del /q", "rd /s"]
-            for dangerous in dangerous_commands:
-                if dangerous in cmd_value.lower():
+            lowered = cmd_value.lower()
+            for dangerous in _DANGEROUS_BATCH:
+                if dangerous in lowered:
                     return False, f"Script contains potentially dangerous operation: {dangerous}"
                     
             return True, ""
@@ -127,12 +353,11 @@ class CommandManager:
                 return False, "Registry command cannot be empty"
                 
             # Check format: path=value or path-
-            if not re.match(r"^[A-Za-z0-9\\:_]+[=\\-].*$", cmd_value):
+            if not _REG_COMMAND_RE.match(cmd_value):
                 return False, "Invalid registry command format. Should be 'path=value' or 'path-'"
                 
             # Check if registry path starts with a valid root key
-            valid_roots = ["HKCU", "HKLM", "HKCR", "HKU", "HKCC"]
-            if not any(cmd_value.startswith(root) for root in valid_roots):
+            if not cmd_value.startswith(_VALID_ROOTS):
                 return False, "Registry path must start with a valid root key (HKCU, HKLM, HKCR, HKU, HKCC)"
                 
             return True, ""
@@ -151,23 +376,8 @@ class CommandManager:
         """
         try:
             # Run the command
-            process = subprocess.run(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            # Combine stdout and stderr
-            output = process.stdout
-            if process.stderr:
-                if output:
-                    output += "\n" + process.stderr
-                else:
-                    output = process.stderr
-            
-            return process.returncode == 0, output
+            returncode, stdout, stderr = _run_captured(command, shell=True)
+            return returncode == 0, _combine_output(stdout, stderr)
         except Exception as e:
             return False, str(e)
     
@@ -182,22 +392,10 @@ class CommandManager:
         """
         try:
             # Run PowerShell with the command
-            process = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", command],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            returncode, stdout, stderr = _run_captured(
+                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", command]
             )
-            
-            # Combine stdout and stderr
-            output = process.stdout
-            if process.stderr:
-                if output:
-                    output += "\n" + process.stderr
-                else:
-                    output = process.stderr
-            
-            return process.returncode == 0, output
+            return returncode == 0, _combine_output(stdout, stderr)
         except Exception as e:
             return False, str(e)
     
@@ -211,125 +409,230 @@ class CommandManager:
             Tuple of (success, output)
         """
         try:
-            # Create a temporary batch file
-            with tempfile.NamedTemporaryFile(suffix=".bat", delete=False, mode="w") as batch_file:
-                batch_file.write(command)
-                batch_file_path = batch_file.name
-            
             # Run the batch file
-            try:
-                process = subprocess.run(
-                    batch_file_path,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Combine stdout and stderr
-                output = process.stdout
-                if process.stderr:
-                    if output:
-                        output += "\n" + process.stderr
-                    else:
-                        output = process.stderr
-                
-                return process.returncode == 0, output
-            finally:
-                # Clean up the temporary file
-                try:
-                    os.remove(batch_file_path)
-                except:
-                    pass
+            batch_file_path = self._get_batch_file(command)
+            returncode, stdout, stderr = _run_captured(batch_file_path, shell=True)
+            return returncode == 0, _combine_output(stdout, stderr)
         except Exception as e:
             return False, str(e)
     
-    def _execute_registry_command(self, command):
-        """Execute a registry command
+    def _get_batch_file(self, command):
+        """Get a temporary batch file holding the given script
+        
+        Files are named after a hash of their content and kept until the
+        process exits, so repeating a script does not write a new file.
         
         Args:
-            command: Registry command to execute (path=value or path-)
+            command: Batch commands to store
             
         Returns:
-            Tuple of (success, output)
+            Path of the batch file
         """
-        try:
-            # Parse command
-            if "=" in command:
-                # Set value
-                path, value = command.split("=", 1)
-                delete = False
-            elif command.endswith("-"):
-                # Delete value
-                path = command[:-1]
-                value = None
-                delete = True
-            else:
-                return False, "Invalid registry command format"
-            
-            # Parse registry path
-            root_key_str, subkey_path = path.split("\\", 1)
-            
-            # Map root key string to actual key
-            root_keys = {
-                "HKCU": winreg.HKEY_CURRENT_USER,
-                "HKLM": winreg.HKEY_LOCAL_MACHINE,
-                "HKCR": winreg.HKEY_CLASSES_ROOT,
-                "HKU": winreg.HKEY_USERS,
-                "HKCC": winreg.HKEY_CURRENT_CONFIG
-            }
+        digest = hashlib.blake2b(command.encode("utf-8"), digest_size=8).hexdigest()
+        
+        # Only this process writes to the directory, so an existing file
+        # already holds this script; the lock stops two threads writing it at once
+        with _batch_lock:
+            batch_dir = _get_batch_dir()
+            batch_file_path = os.path.join(batch_dir, f"{digest}.bat")
+            if not os.path.exists(batch_file_path):
+                # Write under a temporary name and rename, so a failed write
+                # never leaves a partial script to be reused. cmd.exe reads
+                # batch files in the OEM code page.
+                fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=batch_dir)
+                try:
+                    with open(fd, "w", encoding="oem") as batch_file:
+                        batch_file.write(command)
+                    os.replace(temp_path, batch_file_path)
+                except Exception:
+                    os.unlink(temp_path)
+                    raise
+            return batch_file_path
+    
+    def _parse_registry_command(self, command):
+        """Split a registry command into its target and operation
+        
+        Args:
+            command: Registry command (path=value or path-)
             
-            if root_key_str not in root_keys:
-                return False, f"Invalid root key: {root_key_str}"
+        Returns:
+            Tuple of (path, root_key, subkey_path, value_name, value, delete)
             
-            root_key = root_keys[root_key_str]
+        Raises:
+            ValueError: If the command is malformed or the root key is unknown
+        """
+        if "=" in command:
+            # Set value
+            path, value = command.split("=", 1)
+            delete = False
+        elif command.endswith("-"):
+            # Delete value
+            path = command[:-1]
+            value = None
+            delete = True
+        else:
+            raise ValueError("Invalid registry command format")
+        
+        # Parse registry path
+        if "\\" not in path:
+            raise ValueError("Invalid registry command format")
+        root_key_str, subkey_path = path.split("\\", 1)
+        
+        # Map root key string to actual key
+        root_key = _HIVE_MAP.get(root_key_str)
+        if root_key is None:
+            raise ValueError(f"Invalid root key: {root_key_str}")
+        
+        # Get value name (if any)
+        value_name = None
+        if "\\" in subkey_path:
+            # The last element might be a value name
+            *subkey_parts, last_part = subkey_path.split("\\")
             
-            # Get value name (if any)
-            value_name = None
-            if "\\" in subkey_path:
-                # The last element might be a value name
-                *subkey_parts, last_part = subkey_path.split("\\")
-                
-                # If the last part contains non-path characters, it's likely a value name
-                if re.search(r'[^A-Za-z0-9_\-]', last_part):
-                    value_name = last_part
-                    subkey_path = "\\".join(subkey_parts)
+            # If the last part contains non-path characters, it's likely a value name
+            if _VALUE_NAME_CHAR_RE.search(last_part):
+                value_name = last_part
+                subkey_path = "\\".join(subkey_parts)
+        
+        return path, root_key, subkey_path, value_name, value, delete
+    
+    def _apply_registry_edit(self, key, edit):
+        """Apply a parsed registry edit to an open key
+        
+        Args:
+            key: Open registry key with KEY_SET_VALUE access
+            edit: Tuple returned by _parse_registry_command
             
-            # Open the key
-            try:
-                key = winreg.OpenKey(root_key, subkey_path, 0, winreg.KEY_SET_VALUE)
-            except FileNotFoundError:
-                # Create the key if it doesn't exist
-                key = winreg.CreateKey(root_key, subkey_path)
+        Returns:
+            Tuple of (success, output)
             
-            # Perform the requested operation
+        Raises:
+            OSError: If the key handle is stale, so the caller can reopen it
+        """
+        path, root_key, subkey_path, value_name, value, delete = edit
+        try:
             if delete:
                 # Delete the value
-                if value_name:
-                    winreg.DeleteValue(key, value_name)
-                else:
-                    # If no value name is specified, delete the key
-                    winreg.DeleteKey(root_key, subkey_path)
-                
+                winreg.DeleteValue(key, value_name)
                 return True, f"Deleted {path}"
-            else:
-                # Set the value
-                # Determine value type (simple heuristic)
-                if value.isdigit():
-                    # Integer
-                    winreg.SetValueEx(key, value_name, 0, winreg.REG_DWORD, int(value))
-                elif value.startswith("0x"):
-                    # Hex value
-                    winreg.SetValueEx(key, value_name, 0, winreg.REG_DWORD, int(value, 16))
-                else:
-                    # String
-                    winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, value)
-                
-                return True, f"Set {path} = {value}"
+            
+            # Set the value
+            value_type, data = _parse_reg_value(value)
+            winreg.SetValueEx(key, value_name, 0, value_type, data)
+            
+            return True, f"Set {path} = {value}"
+        except FileNotFoundError:
+            return False, f"Registry key not found: {path}"
+        except PermissionError:
+            return False, "Permission denied. Try running as administrator."
+        except OSError as e:
+            if getattr(e, "winerror", None) in _STALE_KEY_ERRORS:
+                raise
+            return False, str(e)
+        except Exception as e:
+            return False, str(e)
+    
+    def _execute_registry_command(self, command):
+        """Execute a registry command
         
+        Args:
+            command: Registry command to execute (path=value or path-)
+            
+        Returns:
+            Tuple of (success, output)
+        """
+        try:
+            edit = self._parse_registry_command(command)
+        except ValueError as e:
+            return False, str(e)
+        
+        path, root_key, subkey_path, value_name, value, delete = edit
+        try:
+            if delete and not value_name:
+                # If no value name is specified, delete the key
+                self._evict_keys(root_key, subkey_path)
+                winreg.DeleteKey(root_key, subkey_path)
+                return True, f"Deleted {path}"
+            
+            # Open the key, creating it if it doesn't exist
+            key = self._open_key(root_key, subkey_path)
         except FileNotFoundError:
             return False, f"Registry key not found: {path}"
         except PermissionError:
             return False, "Permission denied. Try running as administrator."
         except Exception as e:
-            return False, str(e)
\ No newline at end of file
+            return False, str(e)
+        
+        try:
+            return self._apply_registry_edit(key, edit)
+        except OSError:
+            _, result = self._retry_registry_edit(edit)
+            return result
+    
+    def _retry_registry_edit(self, edit):
+        """Retry a registry edit that failed on a stale key handle
+        
+        A cached handle goes stale when its key is deleted or renamed
+        outside this manager, so the handle is closed and the key is
+        opened again before the one retry.
+        
+        Args:
+            edit: Tuple returned by _parse_registry_command
+            
+        Returns:
+            Tuple of (new key or None if it could not be opened, (success, output))
+        """
+        path, root_key, subkey_path, value_name, value, delete = edit
+        self._evict_keys(root_key, subkey_path)
+        try:
+            key = self._open_key(root_key, subkey_path)
+        except PermissionError:
+            return None, (False, "Permission denied. Try running as administrator.")
+        except Exception as e:
+            return None, (False, str(e))
+        
+        try:
+            return key, self._apply_registry_edit(key, edit)
+        except OSError as e:
+            return key, (False, str(e))
+    
+    def _open_key(self, root_key, subkey_path):
+        """Get a writable handle to a registry key, reusing open handles
+        
+        Args:
+            root_key: Root key constant
+            subkey_path: Path below the root key
+            
+        Returns:
+            Open registry key with KEY_SET_VALUE access
+        """
+        cache_key = (root_key, subkey_path.lower())
+        key = self._key_cache.get(cache_key)
+        if key is not None:
+            self._key_cache.move_to_end(cache_key)
+            return key
+        
+        # Open the key, creating it if it doesn't exist
+        key = winreg.CreateKeyEx(root_key, subkey_path, 0, winreg.KEY_SET_VALUE)
+        self._key_cache[cache_key] = key
+        if len(self._key_cache) > _KEY_CACHE_SIZE:
+            self._key_cache.popitem(last=False)[1].Close()
+        return key
+    
+    def _evict_keys(self, root_key, subkey_path):
+        """Close cached handles for a key and everything below it
+        
+        Args:
+            root_key: Root key constant
+            subkey_path: Path below the root key
+        """
+        prefix = subkey_path.lower()
+        for cache_key in list(self._key_cache):
+            cached_root, cached_path = cache_key
+            if cached_root == root_key and (cached_path == prefix or cached_path.startswith(prefix + "\\")):
+                self._key_cache.pop(cache_key).Close()
+    
+    def close_registry_keys(self):
+        """Close every cached registry key handle"""
+        while self._key_cache:
+            self._key_cache.popitem()[1].Close()
@@ -5,18 +5,122 @@ Handles PowerShell command execution
 import subprocess
 import os
 import tempfile
+import base64
+import queue
+import threading
+import time
+import uuid
 from typing import Tuple, Optional, List, Dict, Any
 
+# Worker loop run by the long-lived powershell.exe. Commands arrive on stdin as
+# "<marker> <base64 script>" lines. Each one runs in a fresh runspace, with the
+# process environment and working directory restored afterwards, so nothing a
+# script changes carries over. Native programs get NUL as stdin, so they cannot
+# read the command stream. All output streams are merged with *>&1 and written
+# in order: errors to stderr, everything else to stdout. Afterwards stdout gets
+# the marker plus 1/0 for success and stderr gets the bare marker.
+_WORKER_SCRIPT = r"""
+Add-Type -Namespace WinRegi -Name StdHandle -MemberDefinition '[DllImport("kernel32.dll")] public static extern bool SetStdHandle(int nStdHandle, IntPtr hHandle);'
+$commands = New-Object IO.StreamReader([Console]::OpenStandardInput(), [Text.Encoding]::ASCII)
+$nul = [IO.File]::Open('NUL', 'Open', 'Read', 'ReadWrite')
+[void][WinRegi.StdHandle]::SetStdHandle(-10, $nul.SafeFileHandle.DangerousGetHandle())
+
+while ($null -ne ($line = $commands.ReadLine())) {
+    $marker, $payload = $line.Split([char]' ', 2)
+    $saved_env = [Environment]::GetEnvironmentVariables()
+    $saved_cwd = [Environment]::CurrentDirectory
+    $ps = [PowerShell]::Create()
+    $ok = $false
+    try {
+        $script = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($payload))
+        
+        # Record $? right after the script, before anything else can reset it
+        [void]$ps.AddScript('param($__script) $global:LASTEXITCODE = 0; . ([ScriptBlock]::Create($__script)) *>&1; $global:__ok = $?').AddArgument($script)
+        
+        # Format runs of plain output together, flushing them before each record
+        $pending = New-Object Collections.ArrayList
+        foreach ($item in $ps.Invoke()) {
+            $prefix = $null
+            if ($item -is [Management.Automation.WarningRecord]) { $prefix = 'WARNING: ' }
+            elseif ($item -is [Management.Automation.VerboseRecord]) { $prefix = 'VERBOSE: ' }
+            elseif ($item -is [Management.Automation.DebugRecord]) { $prefix = 'DEBUG: ' }
+            elseif ($item -is [Management.Automation.InformationRecord]) { $prefix = '' }
+            elseif ($item -isnot [Management.Automation.ErrorRecord]) {
+                [void]$pending.Add($item)
+                continue
+            }
+            if ($pending.Count) {
+                [Console]::Out.Write(($pending | Out-String))
+                $pending.Clear()
+            }
+            if ($null -eq $prefix) { [Console]::Error.WriteLine($item) }
+            else { [Console]::Out.WriteLine($prefix + $item) }
+        }
+        if ($pending.Count) { [Console]::Out.Write(($pending | Out-String)) }
+        foreach ($record in $ps.Streams.Error) { [Console]::Error.WriteLine($record) }
+        
+        # __ok is unset when the script ended early through exit
+        $ok = $ps.Runspace.SessionStateProxy.GetVariable('__ok')
+        if ($null -eq $ok) { $ok = -not $ps.HadErrors }
+        $code = $ps.Runspace.SessionStateProxy.GetVariable('LASTEXITCODE')
+        $ok = [bool]$ok -and (-not $code)
+    }
+    catch {
+        [Console]::Error.WriteLine($_.Exception.GetBaseException().Message)
+    }
+    finally {
+        if ($ps.Runspace) { $ps.Runspace.Dispose() }
+        $ps.Dispose()
+        foreach ($name in @([Environment]::GetEnvironmentVariables().Keys)) {
+            if (-not $saved_env.Contains($name)) { [Environment]::SetEnvironmentVariable($name, $null) }
+        }
+        foreach ($entry in $saved_env.GetEnumerator()) { [Environment]::SetEnvironmentVariable($entry.Key, $entry.Value) }
+        [Environment]::CurrentDirectory = $saved_cwd
+    }
+    [Console]::Out.WriteLine($marker + [int]$ok)
+    [Console]::Out.Flush()
+    [Console]::Error.WriteLine($marker)
+    [Console]::Error.Flush()
+}
+"""
+
+_WORKER_ARGS = [
+    "-NoLogo", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass",
+    "-EncodedCommand", base64.b64encode(_WORKER_SCRIPT.encode("utf-16-le")).decode("ascii")
+]
+
+def _pump_lines(stream, lines):
+    """Copy lines from a worker pipe into a queue until the pipe closes
+    
+    Args:
+        stream: Text pipe to read
+        lines: Queue receiving each line, then None at end of stream
+    """
+    try:
+        for line in stream:
+            lines.put(line)
+    finally:
+        lines.put(None)
+
 class PowerShellManager:
     """Manages PowerShell command execution"""
     
     def __init__(self):
         """Initialize PowerShell Manager"""
         self.powershell_path = "powershell.exe"
+        
+        # Long-lived worker shared by execute_command calls, started on first use
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._stdout_lines = None
+        self._stderr_lines = None
     
     def execute_command(self, command: str, timeout: int = 30) -> Tuple[bool, str, str]:
         """Execute a PowerShell command
         
+        Commands run in a long-lived PowerShell worker process, so only the
+        first call pays for starting powershell.exe.
+        
         Args:
             command: PowerShell command to execute
             timeout: Command timeout in seconds
@@ -24,44 +128,117 @@ class PowerShellManager:
         Returns:
             Tuple of (success, stdout, stderr)
         """
-        try:
-            # Log the command for debugging
-            print(f"Executing PowerShell command: {command}")
+        with self._worker_lock:
+            try:
+                # Log the command for debugging
+                print(f"Executing PowerShell command: {command}")
+                
+                worker = self._ensure_worker()
+                
+                # Send the command base64-encoded so it always fits on one stdin line
+                marker = f"<<EOF:{uuid.uuid4().hex}>>"
+                encoded = base64.b64encode(command.encode("utf-8")).decode("ascii")
+                worker.stdin.write(f"{marker} {encoded}\n")
+                worker.stdin.flush()
+                
+                # Read both streams up to the end-of-command marker
+                deadline = time.monotonic() + timeout
+                stdout, status = self._read_until_marker(self._stdout_lines, marker, deadline)
+                stderr, _ = self._read_until_marker(self._stderr_lines, marker, deadline)
+                
+                if status is None:
+                    # The worker itself died; use its exit code
+                    success = worker.wait() == 0
+                    self._worker = None
+                else:
+                    success = status == "1"
+                
+                # Log the command and result for debugging
+                print(f"PowerShell command result: {'Success' if success else 'Failed'}")
+                if stdout:
+                    print(f"Output: {stdout}")
+                if stderr:
+                    print(f"Error: {stderr}")
+                
+                return success, stdout, stderr
+                
+            except subprocess.TimeoutExpired as e:
+                # Kill the worker if it times out; the next command starts a new one
+                self.close()
+                print(f"PowerShell command timed out after {timeout} seconds")
+                return False, e.output or "", f"Command timed out after {timeout} seconds"
             
-            # Create a process to execute the PowerShell command
-            process = subprocess.Popen(
-                [self.powershell_path, "-ExecutionPolicy", "Bypass", "-NoProfile", "-Command", command],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            # Wait for the process to complete with timeout
-            stdout, stderr = process.communicate(timeout=timeout)
-            
-            # Check if the command was successful
-            success = process.returncode == 0
+            except Exception as e:
+                self.close()
+                print(f"Exception executing PowerShell command: {str(e)}")
+                return False, "", str(e)
+    
+    def _ensure_worker(self) -> subprocess.Popen:
+        """Get the running PowerShell worker, starting one if needed
+        
+        Returns:
+            Worker process
+        """
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+        
+        self._worker = subprocess.Popen(
+            [self.powershell_path] + _WORKER_ARGS,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        
+        # Drain both pipes on background threads so neither can fill up and block
+        self._stdout_lines = queue.Queue()
+        self._stderr_lines = queue.Queue()
+        for stream, lines in ((self._worker.stdout, self._stdout_lines), (self._worker.stderr, self._stderr_lines)):
+            threading.Thread(target=_pump_lines, args=(stream, lines), daemon=True).start()
+        
+        return self._worker
+    
+    def _read_until_marker(self, lines: queue.Queue, marker: str, deadline: float) -> Tuple[str, Optional[str]]:
+        """Collect worker output lines up to an end-of-command marker
+        
+        Args:
+            lines: Queue fed by a pipe reader thread
+            marker: End-of-command marker
+            deadline: time.monotonic() value after which to give up
             
-            # Log the command and result for debugging
-            print(f"PowerShell command result: {'Success' if success else 'Failed'}")
-            if stdout:
-                print(f"Output: {stdout}")
-            if stderr:
-                print(f"Error: {stderr}")
+        Returns:
+            Tuple of (output, text following the marker or None if the worker exited)
             
-            return success, stdout, stderr
+        Raises:
+            subprocess.TimeoutExpired: If the marker does not arrive before the deadline
+        """
+        collected = []
+        while True:
+            try:
+                line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired("powershell", 0, output="".join(collected))
             
-        except subprocess.TimeoutExpired:
-            # Kill the process if it times out
-            process.kill()
-            stdout, stderr = process.communicate()
-            print(f"PowerShell command timed out after {timeout} seconds")
-            return False, stdout, f"Command timed out after {timeout} seconds"
-        
-        except Exception as e:
-            print(f"Exception executing PowerShell command: {str(e)}")
-            return False, "", str(e)
+            if line is None:
+                return "".join(collected), None
+            if line.startswith(marker):
+                return "".join(collected), line[len(marker):].strip()
+            collected.append(line)
+    
+    def close(self):
+        """Stop the PowerShell worker process"""
+        if self._worker is not None:
+            try:
+                self._worker.kill()
+            except Exception:
+                pass
+            self._worker = None
+    
+    def __del__(self):
+        """Stop the PowerShell worker when the manager is collected"""
+        self.close()
     
     def execute_script(self, script_content: str, timeout: int = 60) -> Tuple[bool, str, str]:
         """Execute a PowerShell script
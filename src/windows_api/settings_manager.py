@@ -198,10 +198,10 @@ class SettingsManager:
         """
         try:
             # The most reliable way is to use the Settings app
-            import subprocess
+            import os
             
-            # Open Night Light settings
-            subprocess.Popen(["explorer.exe", "ms-settings:nightlight"])
+            # Open Night Light settings through the shell's URI handler
+            os.startfile("ms-settings:nightlight")
             
             # Inform the user what to do
             return {
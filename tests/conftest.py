@@ -0,0 +1,39 @@
+"""
+Shared test setup for WinRegi
+Provides a stand-in winreg module on platforms without one
+"""
+import sys
+import types
+
+def _make_winreg_stub():
+    """Build a winreg stand-in with the constants the src package uses
+    
+    Functions are left out; tests patch the ones they need.
+    
+    Returns:
+        Module object registered in place of winreg
+    """
+    winreg = types.ModuleType("winreg")
+    constants = {
+        "HKEY_CLASSES_ROOT": 0x80000000,
+        "HKEY_CURRENT_USER": 0x80000001,
+        "HKEY_LOCAL_MACHINE": 0x80000002,
+        "HKEY_USERS": 0x80000003,
+        "HKEY_CURRENT_CONFIG": 0x80000005,
+        "KEY_SET_VALUE": 0x0002,
+        "KEY_ALL_ACCESS": 0xF003F,
+        "REG_SZ": 1,
+        "REG_EXPAND_SZ": 2,
+        "REG_BINARY": 3,
+        "REG_DWORD": 4,
+        "REG_MULTI_SZ": 7,
+        "REG_QWORD": 11,
+    }
+    for name, value in constants.items():
+        setattr(winreg, name, value)
+    return winreg
+
+try:
+    import winreg
+except ImportError:
+    sys.modules["winreg"] = _make_winreg_stub()
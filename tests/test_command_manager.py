@@ -0,0 +1,118 @@
+"""
+Tests for CommandManager batch execution
+"""
+from unittest import mock
+
+from src.windows_api.command_manager import CommandManager
+
+KEY = "HKCU\\Software\\WinRegiTest"
+
+def _make_manager(commands, calls):
+    """Build a CommandManager whose command handlers only record calls
+    
+    Args:
+        commands: List of (command_type, command_value) in ID order
+        calls: List receiving one entry per handler call
+        
+    Returns:
+        CommandManager instance
+    """
+    rows = {
+        command_id: {"id": command_id, "command_type": cmd_type, "command_value": cmd_value}
+        for command_id, (cmd_type, cmd_value) in enumerate(commands, 1)
+    }
+    db_manager = mock.Mock()
+    db_manager.get_commands_by_ids.side_effect = lambda ids: {i: rows[i] for i in ids if i in rows}
+    manager = CommandManager(db_manager)
+    
+    def open_key(root_key, subkey_path):
+        calls.append(("open", subkey_path))
+        return object()
+    
+    def apply_edit(key, edit):
+        calls.append(("edit", edit[0]))
+        return True, edit[0]
+    
+    def dispatch(command):
+        calls.append(("run", command["command_value"]))
+        return True, command["command_value"]
+    
+    manager._open_key = open_key
+    manager._apply_registry_edit = apply_edit
+    manager._dispatch_command = dispatch
+    return manager
+
+def test_batch_keeps_order_across_command_types():
+    calls = []
+    manager = _make_manager([
+        ("registry", KEY + "\\First Value=1"),
+        ("system", "echo between"),
+        ("registry", KEY + "\\Second Value=2"),
+        ("registry", KEY + "-"),
+        ("registry", KEY + "\\Third Value=3"),
+    ], calls)
+    
+    results = manager.execute_commands_batch([1, 2, 3, 4, 5])
+    
+    assert calls == [
+        ("open", "Software\\WinRegiTest"),
+        ("edit", KEY + "\\First Value"),
+        ("run", "echo between"),
+        ("open", "Software\\WinRegiTest"),
+        ("edit", KEY + "\\Second Value"),
+        ("run", KEY + "-"),
+        ("open", "Software\\WinRegiTest"),
+        ("edit", KEY + "\\Third Value"),
+    ]
+    assert [result[0] for result in results] == [1, 2, 3, 4, 5]
+
+def test_batch_shares_handle_for_consecutive_edits():
+    calls = []
+    manager = _make_manager([
+        ("registry", KEY + "\\First Value=1"),
+        ("registry", KEY + "\\Second Value=2"),
+    ], calls)
+    
+    results = manager.execute_commands_batch([1, 2, 3])
+    
+    assert calls == [
+        ("open", "Software\\WinRegiTest"),
+        ("edit", KEY + "\\First Value"),
+        ("edit", KEY + "\\Second Value"),
+    ]
+    assert results[2] == (3, False, "Command not found")
+
+def _stale_key_error():
+    """Build the OSError winreg raises for a handle to a deleted key"""
+    error = OSError("Illegal operation attempted on a registry key that has been marked for deletion")
+    error.winerror = 1018
+    return error
+
+def test_stale_cached_handle_is_reopened_and_retried():
+    manager = CommandManager(mock.Mock())
+    stale, fresh = mock.Mock(), mock.Mock()
+    
+    with mock.patch("src.windows_api.command_manager.winreg") as winreg:
+        winreg.CreateKeyEx.side_effect = [stale, fresh]
+        winreg.SetValueEx.side_effect = lambda key, *args: key.write(*args)
+        
+        assert manager._execute_registry_command(KEY + "\\First Value=1")[0]
+        stale.write.side_effect = _stale_key_error()
+        assert manager._execute_registry_command(KEY + "\\First Value=2")[0]
+    
+    stale.Close.assert_called_once()
+    assert fresh.write.call_count == 1
+
+def test_other_edit_errors_keep_the_cached_handle():
+    manager = CommandManager(mock.Mock())
+    
+    with mock.patch("src.windows_api.command_manager.winreg") as winreg:
+        key = winreg.CreateKeyEx.return_value
+        winreg.DeleteValue.side_effect = FileNotFoundError()
+        
+        assert manager._execute_registry_command(KEY + "\\First Value=1")[0]
+        assert not manager._execute_registry_command(KEY + "\\First Value=0xZZ")[0]
+        assert not manager._execute_registry_command(KEY + "\\Missing Value-")[0]
+    
+    assert winreg.CreateKeyEx.call_count == 1
+    key.Close.assert_not_called()